@@ -11,12 +11,8 @@ from flask_restx import Api
 from flask_sqlalchemy import SQLAlchemy
 from flask_marshmallow import Marshmallow
 from flask_migrate import Migrate
-from config import Config
-from dotenv import load_dotenv
-
-# Load environment variables - prioritize config.env
-load_dotenv('config.env')  # Load config.env file FIRST (higher priority)
-load_dotenv()  # Load .env file as backup
+from config import Config  # Importing config loads config.env / .env once
+from app.core.json_provider import OrjsonProvider
 
 # Initialize extensions
 db = SQLAlchemy()
@@ -29,6 +25,7 @@ def create_app(config_class=Config):
     """
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.json = OrjsonProvider(app)  # orjson for jsonify() responses and request.get_json()
     
     # Initialize extensions
     db.init_app(app)
@@ -502,7 +502,7 @@ class CompanyDetail(Resource):
     def get(self, id):
         """Get a specific company profile"""
         try:
-            company = Company.query.get(id)
+            company = Company.full_profile().get(id)
             if not company:
                 api.abort(404, f"Company {id} not found")
             return company_schema.dump(company)
@@ -517,7 +517,7 @@ class CompanyDetail(Resource):
     def put(self, id):
         """Update a company profile"""
         try:
-            company = Company.query.get(id)
+            company = Company.full_profile().get(id)
             if not company:
                 api.abort(404, f"Company {id} not found")
 
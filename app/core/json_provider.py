@@ -0,0 +1,50 @@
+"""
+orjson-backed JSON helpers for TraintiQ Backend
+Provides the Flask JSON provider, the text (de)serializers used by the JSON-in-Text model columns
+and the OrJSON column type used by the native JSON model columns
+"""
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import JSON
+from sqlalchemy.types import TypeDecorator
+
+# Match stdlib json: allow int/UUID/datetime dict keys, which orjson rejects by default
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+def dumps_text(value: Any) -> str:
+    """Serialize a value to a JSON string for storage in a Text column"""
+    return orjson.dumps(value, default=DefaultJSONProvider.default, option=ORJSON_OPTIONS).decode()
+
+def loads_text(value) -> Any:
+    """Parse JSON stored in a Text column"""
+    return orjson.loads(value)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes responses and parses request bodies with orjson"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = ORJSON_OPTIONS | (orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+class OrJSON(TypeDecorator):
+    """JSON column type that encodes and decodes values with orjson instead of the stdlib json module"""
+
+    impl = JSON
+    cache_ok = True
+
+    # Replace (rather than wrap) JSON's processors, which would run json.dumps/json.loads again
+    def bind_processor(self, dialect):
+        def process(value):
+            return None if value is None else dumps_text(value)
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            return None if value is None else orjson.loads(value)
+        return process
@@ -1,7 +1,8 @@
 from datetime import datetime
-from sqlalchemy import Column, String, JSON, Text
+from sqlalchemy import Column, Computed, Index, String, JSON, Text
+from sqlalchemy.orm import deferred, undefer_group
 from app import db
-import json
+from app.core.json_provider import dumps_text, loads_text
 import uuid
 
 def generate_company_id():
@@ -57,25 +58,34 @@ def process_json_dates(data, for_storage=False):
         return datetime_to_iso(data)
     return data
 
+# basicInfo is TEXT that may be edited by hand, so only valid JSON is parsed
+LEGAL_NAME_EXPR = "IF(JSON_VALID(basicInfo), JSON_UNQUOTE(JSON_EXTRACT(basicInfo, '$.legalName')), NULL)"
+
 class Company(db.Model):
     """Company model that matches the frontend TypeScript interface exactly"""
     __tablename__ = 'companies'
+    __table_args__ = (Index('idx_companies_legal_name', 'legal_name_g'),)
 
     # Use a regular id field for SQLAlchemy with auto-generation
     id = Column(String(24), primary_key=True, default=generate_company_id)
     
-    # All fields are TEXT to store JSON data and be easily editable in MySQL Workbench
+    # All fields are TEXT to store JSON data and be easily editable in MySQL Workbench.
+    # The large blobs are deferred (group 'profile') so list queries stay small; touching
+    # one loads the whole group in a single query, and full_profile() loads it upfront.
     basicInfo = Column(Text, nullable=True)  # Maps to BasicInfo interface
     operational = Column(Text, nullable=True)  # Maps to Operational interface
     contact = Column(Text, nullable=True)  # Maps to Contact interface
-    financials = Column(Text, nullable=True)  # Maps to Financials interface
-    descriptive = Column(Text, nullable=True)  # Maps to Descriptive interface
-    relationships = Column(Text, nullable=True)  # Maps to Relationships interface
-    governance = Column(Text, nullable=True)  # Maps to Governance interface
-    digitalPresence = Column(Text, nullable=True)  # Maps to DigitalPresence interface
-    scrapedData = Column(Text, nullable=True)  # Maps to ScrapedData interface
+    financials = deferred(Column(Text, nullable=True), group='profile')  # Maps to Financials interface
+    descriptive = deferred(Column(Text, nullable=True), group='profile')  # Maps to Descriptive interface
+    relationships = deferred(Column(Text, nullable=True), group='profile')  # Maps to Relationships interface
+    governance = deferred(Column(Text, nullable=True), group='profile')  # Maps to Governance interface
+    digitalPresence = deferred(Column(Text, nullable=True), group='profile')  # Maps to DigitalPresence interface
+    scrapedData = deferred(Column(Text, nullable=True), group='profile')  # Maps to ScrapedData interface
     metaInfo = Column(Text, nullable=True)  # Maps to Metadata interface
-    customSections = Column(Text, nullable=True)  # Maps to customSections
+    customSections = deferred(Column(Text, nullable=True), group='profile')  # Maps to customSections
+
+    # basicInfo.legalName kept by MySQL in a stored, indexed column so name lookups skip JSON parsing
+    legal_name_g = Column(String(255), Computed(LEGAL_NAME_EXPR, persisted=True))
 
     def __init__(self, **kwargs):
         """Initialize with default empty JSON objects for all fields"""
@@ -87,7 +97,7 @@ class Company(db.Model):
         for key, value in kwargs.items():
             if isinstance(value, (dict, list)):
                 processed_value = process_json_dates(value, for_storage=True)
-                kwargs[key] = json.dumps(processed_value)
+                kwargs[key] = dumps_text(processed_value)
             elif value is None:
                 kwargs[key] = '{}'
 
@@ -105,9 +115,14 @@ class Company(db.Model):
         self.metaInfo = kwargs.get('metaInfo', '{}')
         self.customSections = kwargs.get('customSections', '{}')
 
+    @classmethod
+    def full_profile(cls):
+        """Query that eagerly loads the deferred profile columns, for detail views"""
+        return cls.query.options(undefer_group('profile'))
+
     def __repr__(self):
         """String representation of the company"""
-        basic_info = json.loads(self.basicInfo) if self.basicInfo else {}
+        basic_info = loads_text(self.basicInfo) if self.basicInfo else {}
         if basic_info and basic_info.get('legalName'):
             return f"<Company {basic_info['legalName']}>"
         return "<Company Unnamed>"
@@ -116,17 +131,17 @@ class Company(db.Model):
         """Convert model to dictionary matching frontend interface"""
         return {
             "id": self.id,
-            "basicInfo": process_json_dates(json.loads(self.basicInfo) if self.basicInfo else {}, for_storage=False),
-            "operational": process_json_dates(json.loads(self.operational) if self.operational else {}, for_storage=False),
-            "contact": process_json_dates(json.loads(self.contact) if self.contact else {}, for_storage=False),
-            "financials": process_json_dates(json.loads(self.financials) if self.financials else {}, for_storage=False),
-            "descriptive": process_json_dates(json.loads(self.descriptive) if self.descriptive else {}, for_storage=False),
-            "relationships": process_json_dates(json.loads(self.relationships) if self.relationships else {}, for_storage=False),
-            "governance": process_json_dates(json.loads(self.governance) if self.governance else {}, for_storage=False),
-            "digitalPresence": process_json_dates(json.loads(self.digitalPresence) if self.digitalPresence else {}, for_storage=False),
-            "scrapedData": process_json_dates(json.loads(self.scrapedData) if self.scrapedData else {}, for_storage=False),
-            "metaInfo": process_json_dates(json.loads(self.metaInfo) if self.metaInfo else {}, for_storage=False),
-            "customSections": process_json_dates(json.loads(self.customSections) if self.customSections else {}, for_storage=False)
+            "basicInfo": process_json_dates(loads_text(self.basicInfo) if self.basicInfo else {}, for_storage=False),
+            "operational": process_json_dates(loads_text(self.operational) if self.operational else {}, for_storage=False),
+            "contact": process_json_dates(loads_text(self.contact) if self.contact else {}, for_storage=False),
+            "financials": process_json_dates(loads_text(self.financials) if self.financials else {}, for_storage=False),
+            "descriptive": process_json_dates(loads_text(self.descriptive) if self.descriptive else {}, for_storage=False),
+            "relationships": process_json_dates(loads_text(self.relationships) if self.relationships else {}, for_storage=False),
+            "governance": process_json_dates(loads_text(self.governance) if self.governance else {}, for_storage=False),
+            "digitalPresence": process_json_dates(loads_text(self.digitalPresence) if self.digitalPresence else {}, for_storage=False),
+            "scrapedData": process_json_dates(loads_text(self.scrapedData) if self.scrapedData else {}, for_storage=False),
+            "metaInfo": process_json_dates(loads_text(self.metaInfo) if self.metaInfo else {}, for_storage=False),
+            "customSections": process_json_dates(loads_text(self.customSections) if self.customSections else {}, for_storage=False)
         }
 
     @classmethod
@@ -145,7 +160,7 @@ class Company(db.Model):
         for k, v in data.items():
             if isinstance(v, (dict, list)):
                 processed_value = process_json_dates(v, for_storage=True)
-                processed_data[k] = json.dumps(processed_value)
+                processed_data[k] = dumps_text(processed_value)
             else:
                 processed_data[k] = v
             
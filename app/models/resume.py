@@ -1,9 +1,19 @@
-from sqlalchemy import Column, String, Text, Integer, Float, DateTime, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, String, Text, Integer, Float, DateTime, Boolean, ForeignKey, Index, Computed
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
+import os
+import time
 import uuid
 from .. import db
+from ..core.json_provider import OrJSON
+
+def generate_uuid7():
+    """Generate a time-ordered UUIDv7 string so new primary keys append to the end of the index"""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
 
 class Resume(db.Model):
     """
@@ -11,7 +21,7 @@ class Resume(db.Model):
     """
     __tablename__ = 'resumes'
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=generate_uuid7)
     user_id = Column(String(36), nullable=True)  # Will add FK when User model exists
     
     # File information
@@ -26,15 +36,17 @@ class Resume(db.Model):
     
     # Extraction information
     current_extraction_id = Column(String(36), nullable=True)
-    extracted_data = Column(JSON, nullable=True)
+    extracted_data = Column(OrJSON, nullable=True)
     confidence_score = Column(Float, nullable=True)
+    # Stored copy of the extracted email so lookups hit an index instead of scanning the JSON
+    email_idx = Column(String(255), Computed("NULLIF(extracted_data ->> '$.contact_details.email', 'null')", persisted=True), index=True)
     
     # Timestamps
     upload_time = Column(DateTime, nullable=False, default=datetime.utcnow)
     last_updated = Column(DateTime, nullable=True)
     
     # Additional metadata
-    resume_metadata = Column(JSON, nullable=True)
+    resume_metadata = Column(OrJSON, nullable=True)
     
     # Relationships
     sections = relationship("ResumeSection", back_populates="resume", cascade="all, delete-orphan")
@@ -62,13 +74,14 @@ class ResumeSection(db.Model):
     Model for storing extracted resume sections (experience, education, skills, etc.)
     """
     __tablename__ = 'resume_sections'
+    __table_args__ = (Index('ix_section_resume_name', 'resume_id', 'section_name', unique=True),)
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=generate_uuid7)
     resume_id = Column(String(36), ForeignKey('resumes.id'), nullable=False)
     
     # Section information
     section_name = Column(String(100), nullable=False)  # e.g., 'work_experience', 'education', 'skills'
-    section_data = Column(JSON, nullable=False)
+    section_data = Column(OrJSON, nullable=False)
     
     # Quality metrics
     confidence_score = Column(Float, nullable=True)
@@ -103,13 +116,14 @@ class ExtractionJob(db.Model):
     Model for tracking AI extraction jobs and their progress
     """
     __tablename__ = 'extraction_jobs'
+    __table_args__ = (Index('ix_extraction_jobs_resume_status', 'resume_id', 'status'),)
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=generate_uuid7)
     resume_id = Column(String(36), ForeignKey('resumes.id'), nullable=False)
     user_id = Column(String(36), nullable=True)  # Will add FK when User model exists
     
     # Job configuration
-    extraction_options = Column(JSON, nullable=False)
+    extraction_options = Column(OrJSON, nullable=False)
     
     # Progress tracking
     status = Column(String(50), nullable=False, default='queued')
@@ -119,7 +133,7 @@ class ExtractionJob(db.Model):
     progress = Column(Integer, default=0)  # 0-100
     
     # Results
-    extracted_data = Column(JSON, nullable=True)
+    extracted_data = Column(OrJSON, nullable=True)
     error_message = Column(Text, nullable=True)
     
     # Performance metrics
@@ -168,19 +182,20 @@ class ResumeTemplate(db.Model):
     Model for storing resume templates and formatting options
     """
     __tablename__ = 'resume_templates'
+    __table_args__ = (Index('uq_resume_templates_name', 'name', unique=True),)
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=generate_uuid7)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
     
     # Template configuration
     template_type = Column(String(50), nullable=False)  # 'modern', 'classic', 'creative', 'ats-friendly'
-    template_data = Column(JSON, nullable=False)  # CSS, HTML structure, etc.
+    template_data = Column(OrJSON, nullable=False)  # CSS, HTML structure, etc.
     
     # Template metadata
     is_public = Column(Boolean, default=True)
     created_by = Column(String(36), nullable=True)  # Will add FK when User model exists
-    tags = Column(JSON, nullable=True)  # Array of tags like ['tech', 'creative', 'executive']
+    tags = Column(OrJSON, nullable=True)  # Array of tags like ['tech', 'creative', 'executive']
     
     # Usage statistics
     usage_count = Column(Integer, default=0)
@@ -212,15 +227,16 @@ class ResumeGeneration(db.Model):
     Model for tracking generated resume documents
     """
     __tablename__ = 'resume_generations'
+    __table_args__ = (Index('ix_resume_generations_resume_template_status', 'resume_id', 'template_id', 'status'),)
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=generate_uuid7)
     resume_id = Column(String(36), ForeignKey('resumes.id'), nullable=False)
     template_id = Column(String(36), ForeignKey('resume_templates.id'), nullable=False)
     user_id = Column(String(36), nullable=True)  # Will add FK when User model exists
     
     # Generation configuration
     format_type = Column(String(20), nullable=False)  # 'pdf', 'html', 'docx'
-    generation_options = Column(JSON, nullable=True)
+    generation_options = Column(OrJSON, nullable=True)
     
     # Output information
     output_filename = Column(String(255), nullable=True)
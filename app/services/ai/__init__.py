@@ -11,7 +11,7 @@ This module contains all AI-related services including:
 
 from .chat_service import ChatService
 from .prompt_engine import PromptEngine
-from .knowledge_base import KnowledgeBase
+from .knowledge_base import KnowledgeBase, KB
 from .profile_generator import ProfileGenerator
 from .enhanced_profile_generator import EnhancedProfileGenerator
 
@@ -19,6 +19,7 @@ __all__ = [
     'ChatService',
     'PromptEngine', 
     'KnowledgeBase',
+    'KB',
     'ProfileGenerator',
     'EnhancedProfileGenerator'
 ] 
\ No newline at end of file
@@ -19,7 +19,7 @@ except ImportError:
 from app.core.base_service import BaseService
 from app.core.decorators import log_execution_time, handle_exceptions
 from app.services.ai.prompt_engine import PromptEngine
-from app.services.ai.knowledge_base import KnowledgeBase
+from app.services.ai.knowledge_base import KB
 
 class ChatService(BaseService):
     """
@@ -48,7 +48,7 @@ class ChatService(BaseService):
             
             # Initialize AI modules
             self.prompt_engine = PromptEngine()
-            self.knowledge_base = KnowledgeBase()
+            self.knowledge_base = KB
             
             # Initialize OpenAI client if available
             if OPENAI_AVAILABLE:
@@ -2,22 +2,28 @@
 TraintiQ Knowledge Base - 10 Sample Q&A with Knowledge Graph
 """
 
-from typing import Dict, List, Any, Optional
+from collections import deque
+from functools import cached_property, lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 import json
 
-class KnowledgeBase:
-    def __init__(self):
-        self.qa_database = self._load_qa_database()
-        self.knowledge_graph = self._build_knowledge_graph()
-    
-    def _load_qa_database(self) -> List[Dict[str, Any]]:
-        """Load 10 curated Q&A pairs for TraintiQ"""
-        return [
-            {
-                "id": 1,
-                "question": "What services does TraintiQ offer?",
-                "intent": "services",
-                "answer": """🚀 **TraintiQ offers comprehensive AI-powered HR solutions:**
+# Questions longer than this are matched but not memoized
+MATCH_CACHE_MAX_QUESTION_LENGTH = 256
+MATCH_CACHE_SIZE = 2048
+
+# Match scoring weights; a Q&A needs more than MIN_MATCH_SCORE to be returned
+INTENT_WEIGHT = 40
+KEYWORD_WEIGHT = 20
+WORD_WEIGHT = 5
+MIN_MATCH_SCORE = 30
+
+# Curated Q&A pairs for TraintiQ, parsed once at import
+_QA_DATABASE = [
+    {
+        "id": 1,
+        "question": "What services does TraintiQ offer?",
+        "intent": "services",
+        "answer": """🚀 **TraintiQ offers comprehensive AI-powered HR solutions:**
 
 • **AI-Powered CV Analysis** - Advanced resume screening using GPT-4 technology
 • **Employee Profile Generation** - Automated creation of comprehensive employee profiles  
@@ -27,15 +33,15 @@ class KnowledgeBase:
 Our platform streamlines recruitment, enhances employee development, and optimizes talent management through cutting-edge artificial intelligence.
 
 *Would you like to learn more about any specific service?*""",
-                "quick_replies": ["CV Analysis", "Skills Matching", "Pricing", "Demo"],
-                "keywords": ["services", "offer", "solutions", "products"],
-                "category": "services"
-            },
-            {
-                "id": 2,
-                "question": "Tell me about your pricing plans",
-                "intent": "pricing", 
-                "answer": """💰 **TraintiQ Pricing Plans:**
+        "quick_replies": ["CV Analysis", "Skills Matching", "Pricing", "Demo"],
+        "keywords": ["services", "offer", "solutions", "products"],
+        "category": "services"
+    },
+    {
+        "id": 2,
+        "question": "Tell me about your pricing plans",
+        "intent": "pricing", 
+        "answer": """💰 **TraintiQ Pricing Plans:**
 
 **Starter Plan - $29/month**
 • Basic CV Analysis (up to 100 profiles)
@@ -55,15 +61,15 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
 • On-premise deployment
 
 *Ready to start with a free trial?*""",
-                "quick_replies": ["Free Trial", "Compare Plans", "Enterprise", "Contact Sales"],
-                "keywords": ["pricing", "plans", "cost", "price"],
-                "category": "pricing"
-            },
-            {
-                "id": 3,
-                "question": "How can I contact support?",
-                "intent": "contact",
-                "answer": """📞 **TraintiQ Support:**
+        "quick_replies": ["Free Trial", "Compare Plans", "Enterprise", "Contact Sales"],
+        "keywords": ["pricing", "plans", "cost", "price"],
+        "category": "pricing"
+    },
+    {
+        "id": 3,
+        "question": "How can I contact support?",
+        "intent": "contact",
+        "answer": """📞 **TraintiQ Support:**
 
 **Contact Methods:**
 • **Support Email:** support@traintiq.com
@@ -76,15 +82,15 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
 • Sales: Within 1 hour
 
 *What type of assistance do you need?*""",
-                "quick_replies": ["Technical Support", "Sales Inquiry", "Live Chat", "Documentation"],
-                "keywords": ["contact", "support", "help", "email"],
-                "category": "contact"
-            },
-            {
-                "id": 4,
-                "question": "What makes TraintiQ different?",
-                "intent": "differentiation",
-                "answer": """🌟 **What Sets TraintiQ Apart:**
+        "quick_replies": ["Technical Support", "Sales Inquiry", "Live Chat", "Documentation"],
+        "keywords": ["contact", "support", "help", "email"],
+        "category": "contact"
+    },
+    {
+        "id": 4,
+        "question": "What makes TraintiQ different?",
+        "intent": "differentiation",
+        "answer": """🌟 **What Sets TraintiQ Apart:**
 
 • **Advanced AI:** Powered by GPT-4 and custom models
 • **Comprehensive Solution:** End-to-end HR automation
@@ -93,15 +99,15 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
 • **Industry Expertise:** Built by HR technology veterans
 
 *Ready to see the difference? Let's schedule a demo!*""",
-                "quick_replies": ["Schedule Demo", "Case Studies", "Security Info", "Customer Reviews"],
-                "keywords": ["different", "unique", "better", "advantage"],
-                "category": "differentiation"
-            },
-            {
-                "id": 5,
-                "question": "Can I get a demo?",
-                "intent": "demo",
-                "answer": """🎯 **Demo Options:**
+        "quick_replies": ["Schedule Demo", "Case Studies", "Security Info", "Customer Reviews"],
+        "keywords": ["different", "unique", "better", "advantage"],
+        "category": "differentiation"
+    },
+    {
+        "id": 5,
+        "question": "Can I get a demo?",
+        "intent": "demo",
+        "answer": """🎯 **Demo Options:**
 
 **Live Demo (Recommended)**
 • 30-minute guided tour
@@ -118,15 +124,15 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
 • Available immediately
 
 *Which option works best for you?*""",
-                "quick_replies": ["Live Demo", "Free Trial", "Self-Guided", "Contact Sales"],
-                "keywords": ["demo", "trial", "test", "preview"],
-                "category": "demo"
-            },
-            {
-                "id": 6,
-                "question": "What industries do you serve?",
-                "intent": "industries",
-                "answer": """🏢 **Industries We Serve:**
+        "quick_replies": ["Live Demo", "Free Trial", "Self-Guided", "Contact Sales"],
+        "keywords": ["demo", "trial", "test", "preview"],
+        "category": "demo"
+    },
+    {
+        "id": 6,
+        "question": "What industries do you serve?",
+        "intent": "industries",
+        "answer": """🏢 **Industries We Serve:**
 
 **Primary Sectors:**
 • Technology Companies
@@ -141,15 +147,15 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
 • Financial firm: 200% recruitment scale
 
 *What industry are you in? I can share specific examples!*""",
-                "quick_replies": ["Technology", "Healthcare", "Financial", "Manufacturing"],
-                "keywords": ["industries", "sectors", "companies"],
-                "category": "industries"
-            },
-            {
-                "id": 7,
-                "question": "How does your AI work?",
-                "intent": "technology",
-                "answer": """🔬 **TraintiQ AI Technology:**
+        "quick_replies": ["Technology", "Healthcare", "Financial", "Manufacturing"],
+        "keywords": ["industries", "sectors", "companies"],
+        "category": "industries"
+    },
+    {
+        "id": 7,
+        "question": "How does your AI work?",
+        "intent": "technology",
+        "answer": """🔬 **TraintiQ AI Technology:**
 
 **Core Components:**
 • **GPT-4 Foundation** - Latest OpenAI technology
@@ -165,15 +171,15 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
 **Security:** End-to-end encryption and privacy protection
 
 *Want technical details? Our engineering team can help!*""",
-                "quick_replies": ["Technical Demo", "API Docs", "Security", "Integration"],
-                "keywords": ["AI", "technology", "how", "work"],
-                "category": "technology"
-            },
-            {
-                "id": 8,
-                "question": "What are your company values?",
-                "intent": "culture",
-                "answer": """🌟 **TraintiQ Values & Culture:**
+        "quick_replies": ["Technical Demo", "API Docs", "Security", "Integration"],
+        "keywords": ["AI", "technology", "how", "work"],
+        "category": "technology"
+    },
+    {
+        "id": 8,
+        "question": "What are your company values?",
+        "intent": "culture",
+        "answer": """🌟 **TraintiQ Values & Culture:**
 
 **Core Values:**
 • Innovation & Excellence
@@ -193,15 +199,15 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
 • Latest technology equipment
 
 *Interested in joining our team?*""",
-                "quick_replies": ["Careers", "Benefits", "Team", "Mission"],
-                "keywords": ["culture", "values", "company", "team"],
-                "category": "culture"
-            },
-            {
-                "id": 9,
-                "question": "Do you offer integrations?",
-                "intent": "integrations",
-                "answer": """🔗 **Integration & API Solutions:**
+        "quick_replies": ["Careers", "Benefits", "Team", "Mission"],
+        "keywords": ["culture", "values", "company", "team"],
+        "category": "culture"
+    },
+    {
+        "id": 9,
+        "question": "Do you offer integrations?",
+        "intent": "integrations",
+        "answer": """🔗 **Integration & API Solutions:**
 
 **Pre-built Integrations:**
 • ATS Systems (Workday, BambooHR)
@@ -220,15 +226,15 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
 • Dedicated engineering team
 
 *Need a specific integration?*""",
-                "quick_replies": ["API Docs", "Integration List", "Custom Dev", "Technical Support"],
-                "keywords": ["integration", "API", "connect", "sync"],
-                "category": "integrations"
-            },
-            {
-                "id": 10,
-                "question": "How secure is my data?",
-                "intent": "security",
-                "answer": """🔒 **Enterprise Security:**
+        "quick_replies": ["API Docs", "Integration List", "Custom Dev", "Technical Support"],
+        "keywords": ["integration", "API", "connect", "sync"],
+        "category": "integrations"
+    },
+    {
+        "id": 10,
+        "question": "How secure is my data?",
+        "intent": "security",
+        "answer": """🔒 **Enterprise Security:**
 
 **Compliance:**
 • SOC 2 Type II certified
@@ -248,14 +254,41 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
 • Transparent policies
 
 *Need security documentation for your team?*""",
-                "quick_replies": ["Security Docs", "Compliance", "Data Agreement", "Privacy Policy"],
-                "keywords": ["security", "data", "privacy", "safe"],
-                "category": "security"
-            }
-        ]
+        "quick_replies": ["Security Docs", "Compliance", "Data Agreement", "Privacy Policy"],
+        "keywords": ["security", "data", "privacy", "safe"],
+        "category": "security"
+    }
+]
+
+class KnowledgeBase:
+    def __init__(self):
+        self.qa_database = _QA_DATABASE
+        self._by_id = {qa["id"]: qa for qa in self.qa_database}
+        self._build_match_columns()
+        self._cached_match_id = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._find_best_match_id)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Ship the built tables to other processes without the per-process match cache"""
+        state = self.__dict__.copy()
+        del state["_cached_match_id"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cached_match_id = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._find_best_match_id)
     
-    def _build_knowledge_graph(self) -> Dict[str, Any]:
-        """Knowledge graph mapping concepts and relationships"""
+    def _build_match_columns(self) -> None:
+        """Build parallel per-field columns of the Q&A entries for scoring"""
+        self._ids = tuple(qa["id"] for qa in self.qa_database)
+        self._intents = tuple(qa["intent"] for qa in self.qa_database)
+        self._keywords = tuple(tuple(qa["keywords"]) for qa in self.qa_database)
+        self._question_words = tuple(
+            frozenset(qa["question"].lower().split()) for qa in self.qa_database
+        )
+    
+    @cached_property
+    def knowledge_graph(self) -> Dict[str, Any]:
+        """Knowledge graph mapping concepts and relationships, built on first use"""
         return {
             "entities": {
                 "TraintiQ": {
@@ -287,34 +320,93 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
             }
         }
     
+    @cached_property
+    def _graph_index(self) -> Tuple[Dict[str, int], List[str], List[Tuple[int, ...]]]:
+        """Index graph entities by integer id with an adjacency list of connected ids"""
+        node_ids: Dict[str, int] = {}
+        node_names: List[str] = []
+        edges: List[List[int]] = []
+        
+        def node_id(name: str) -> int:
+            key = name.lower()
+            if key not in node_ids:
+                node_ids[key] = len(node_names)
+                node_names.append(name)
+                edges.append([])
+            return node_ids[key]
+        
+        for name, entity in self.knowledge_graph["entities"].items():
+            source = node_id(name)
+            for target in entity.get("connects_to", []):
+                target_id = node_id(target)
+                if target_id != source and target_id not in edges[source]:
+                    edges[source].append(target_id)
+        
+        return node_ids, node_names, [tuple(targets) for targets in edges]
+    
+    def related(self, name: str, depth: int = 2) -> List[str]:
+        """Get concepts reachable from an entity within `depth` hops, nearest first"""
+        node_ids, node_names, adjacency = self._graph_index
+        start = node_ids.get(name.lower())
+        if start is None:
+            return []
+        
+        seen = {start}
+        found = []
+        queue = deque([(start, 0)])
+        while queue:
+            node, distance = queue.popleft()
+            if distance >= depth:
+                continue
+            for neighbour in adjacency[node]:
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    found.append(node_names[neighbour])
+                    queue.append((neighbour, distance + 1))
+        return found
+    
     def find_best_match(self, question: str, intent: str = None) -> Optional[Dict[str, Any]]:
         """Find best matching Q&A for user question"""
-        question_lower = question.lower()
+        question_lower = question.strip().lower()
+        if len(question_lower) <= MATCH_CACHE_MAX_QUESTION_LENGTH:
+            match_id = self._cached_match_id(question_lower, intent)
+        else:
+            match_id = self._find_best_match_id(question_lower, intent)
+        return self._by_id.get(match_id) if match_id is not None else None
+    
+    def _find_best_match_id(self, question_lower: str, intent: Optional[str]) -> Optional[int]:
+        """Score every Q&A against a normalized question and return the winning id"""
         best_match = None
-        highest_score = 0
+        # A match has to beat both the best score so far and the minimum score
+        score_to_beat = MIN_MATCH_SCORE
+        question_words = set(question_lower.split())
         
-        for qa in self.qa_database:
+        for qa_id, qa_intent, keywords, qa_words in zip(
+            self._ids, self._intents, self._keywords, self._question_words
+        ):
             score = 0
             
             # Intent match (high weight)
-            if intent and intent == qa["intent"]:
-                score += 40
+            if intent and intent == qa_intent:
+                score += INTENT_WEIGHT
+            
+            # Skip entries that cannot win even if every remaining signal matches
+            max_word_overlap = min(len(qa_words), len(question_words))
+            if score + KEYWORD_WEIGHT * len(keywords) + WORD_WEIGHT * max_word_overlap <= score_to_beat:
+                continue
             
             # Keyword matching
-            for keyword in qa["keywords"]:
+            for keyword in keywords:
                 if keyword in question_lower:
-                    score += 20
+                    score += KEYWORD_WEIGHT
             
             # Question similarity
-            qa_words = qa["question"].lower().split()
-            question_words = question_lower.split()
-            common_words = set(qa_words) & set(question_words)
-            if common_words:
-                score += len(common_words) * 5
+            if not qa_words.isdisjoint(question_words):
+                score += len(qa_words & question_words) * WORD_WEIGHT
             
-            if score > highest_score and score > 30:
-                highest_score = score
-                best_match = qa
+            if score > score_to_beat:
+                score_to_beat = score
+                best_match = qa_id
         
         return best_match
     
@@ -328,4 +420,7 @@ Our platform streamlines recruitment, enhances employee development, and optimiz
     
     def get_all_categories(self) -> List[str]:
         """Get all available categories"""
-        return list(set(qa["category"] for qa in self.qa_database)) 
\ No newline at end of file
+        return list(set(qa["category"] for qa in self.qa_database))
+
+# Process-wide instance shared by request handlers
+KB = KnowledgeBase()
@@ -13,7 +13,7 @@ import re
 from dataclasses import dataclass
 from ... import db
 from ...models.resume import ExtractionJob, ResumeSection, Resume
-from ...config import Config
+from config import Config
 
 # Configure logging
 logger = logging.getLogger(__name__)
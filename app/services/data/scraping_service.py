@@ -16,6 +16,17 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 import json
 
+# Prefer the libxml2-backed parser; html.parser is pure Python and much slower
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Upper bound on how much of a page body is downloaded and parsed
+MAX_HTML_BYTES = 2_000_000
+STREAM_CHUNK_SIZE = 65536
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -132,20 +143,31 @@ class EnhancedScrapingService:
             raise e
 
     def _scrape_with_requests(self, url: str, metadata: Dict[str, Any]) -> str:
-        """Scrape using requests library"""
+        """Scrape using requests library, streaming the body up to MAX_HTML_BYTES"""
         try:
             logger.info(f"Attempting to scrape {url} with requests...")
-            response = self.session.get(url, timeout=10, allow_redirects=True)
-            response.raise_for_status()
-            metadata['status_code'] = response.status_code
-            logger.info(f"Successfully got response from {url}, status: {response.status_code}")
-            
-            # Check if content is HTML
-            content_type = response.headers.get('content-type', '').lower()
-            if 'text/html' not in content_type:
-                logger.warning(f"Non-HTML content type for {url}: {content_type}")
-            
-            return response.text
+            with self.session.get(url, timeout=10, allow_redirects=True, stream=True) as response:
+                response.raise_for_status()
+                metadata['status_code'] = response.status_code
+                logger.info(f"Successfully got response from {url}, status: {response.status_code}")
+                
+                # Bail out before downloading anything that is not HTML
+                content_type = response.headers.get('content-type', '').lower()
+                if content_type and 'html' not in content_type:
+                    raise ValueError(f"Non-HTML content type for {url}: {content_type}")
+                
+                content_length = response.headers.get('content-length')
+                if content_length and content_length.isdigit() and int(content_length) > MAX_HTML_BYTES:
+                    logger.warning(f"Content-Length {content_length} for {url} exceeds limit, truncating")
+                
+                buffer = bytearray()
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    buffer.extend(chunk)
+                    if len(buffer) >= MAX_HTML_BYTES:
+                        logger.warning(f"Response from {url} truncated at {MAX_HTML_BYTES} bytes")
+                        break
+                
+                return buffer[:MAX_HTML_BYTES].decode(response.encoding or 'utf-8', errors='replace')
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Requests scraping failed for {url}: {e}")
@@ -178,7 +200,7 @@ class EnhancedScrapingService:
 
     def _extract_comprehensive_data(self, html_content: str, url: str) -> Dict[str, Any]:
         """Extract comprehensive company data from HTML content"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         
         # Remove unwanted elements
         for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
@@ -513,7 +535,7 @@ class EnhancedScrapingService:
         """Parse HTML content using BeautifulSoup - legacy method"""
         if not html_content:
             raise ValueError("HTML content cannot be empty for parsing.")
-        return BeautifulSoup(html_content, 'html.parser')
+        return BeautifulSoup(html_content, HTML_PARSER)
 
     async def scrape_url_content(self, url: str) -> Dict[str, Any]:
         """
@@ -1,7 +1,10 @@
 import pymysql
-import json
+import orjson
 from config import Config
 
+# Skip JSON pretty-printing for very large text columns
+MAX_JSON_PRETTY_BYTES = 1_000_000
+
 def check_database():
     # Connect to MySQL
     connection = pymysql.connect(
@@ -9,41 +12,63 @@ def check_database():
         user=Config.MYSQL_USER,
         password=Config.MYSQL_PASSWORD,
         database=Config.MYSQL_DB,
-        cursorclass=pymysql.cursors.DictCursor  # Return results as dictionaries
+        cursorclass=pymysql.cursors.SSDictCursor  # Stream results as dictionaries
     )
     
     try:
         with connection.cursor() as cursor:
-            # Show all tables
-            cursor.execute("SHOW TABLES")
-            tables = cursor.fetchall()
+            # All table names and column definitions in two metadata queries
+            cursor.execute(
+                "SELECT table_name AS table_name FROM information_schema.tables "
+                "WHERE table_schema = %s ORDER BY table_name",
+                (Config.MYSQL_DB,)
+            )
+            table_names = [row['table_name'] for row in cursor.fetchall()]
+            
+            cursor.execute(
+                "SELECT table_name AS table_name, column_name AS column_name, column_type AS column_type "
+                "FROM information_schema.columns WHERE table_schema = %s "
+                "ORDER BY table_name, ordinal_position",
+                (Config.MYSQL_DB,)
+            )
+            columns_by_table = {name: [] for name in table_names}
+            for col in cursor.fetchall():
+                columns_by_table.setdefault(col['table_name'], []).append(col)
+            
+            # Exact row counts for every table in a single round-trip
+            totals = {}
+            if table_names:
+                cursor.execute("SELECT " + ", ".join(
+                    f"(SELECT COUNT(*) FROM `{name}`) AS `{name}`" for name in table_names
+                ))
+                totals = cursor.fetchall()[0]
+            
             print("\n📊 Tables in database:")
-            for table in tables:
-                table_name = table['Tables_in_' + Config.MYSQL_DB]
+            for table_name in table_names:
                 print(f"\n📋 Table: {table_name}")
                 
                 # Show table structure
-                cursor.execute(f"DESCRIBE {table_name}")
-                columns = cursor.fetchall()
                 print("\nColumns:")
-                for col in columns:
-                    print(f"  - {col['Field']}: {col['Type']}")
+                for col in columns_by_table[table_name]:
+                    print(f"  - {col['column_name']}: {col['column_type']}")
                 
-                # Show records
-                cursor.execute(f"SELECT * FROM {table_name}")
-                records = cursor.fetchall()
-                print(f"\nFound {len(records)} records:")
+                # Fetch only the sample we display
+                total = totals[table_name]
+                print(f"\nFound {total} records:")
                 
-                if len(records) > 0:
-                    for record in records[:3]:  # Show first 3 records
+                if total > 0:
+                    cursor.execute(f"SELECT * FROM `{table_name}` LIMIT 3")
+                    records = cursor.fetchall()
+                    for record in records:  # Show first 3 records
                         print("\n🔍 Record:")
                         for key, value in record.items():
-                            if isinstance(value, (str, bytes)) and value.startswith('{'):
+                            if (isinstance(value, (str, bytes)) and value[:1] in ('{', b'{')
+                                    and len(value) < MAX_JSON_PRETTY_BYTES):
                                 try:
                                     # Try to pretty print JSON fields
-                                    parsed = json.loads(value)
+                                    parsed = orjson.loads(value)
                                     print(f"  {key}:")
-                                    print(json.dumps(parsed, indent=2))
+                                    print(orjson.dumps(parsed, option=orjson.OPT_INDENT_2).decode())
                                 except:
                                     print(f"  {key}: {value}")
                             else:
@@ -99,14 +99,19 @@ def create_default_templates():
             }
         ]
         
-        for template_data in templates:
-            existing_template = ResumeTemplate.query.filter_by(name=template_data['name']).first()
-            if not existing_template:
-                template = ResumeTemplate(**template_data)
-                db.session.add(template)
+        # One query for the names that already exist, one batched insert for the rest
+        existing = {
+            name for (name,) in db.session.query(ResumeTemplate.name)
+            .filter(ResumeTemplate.name.in_([t['name'] for t in templates]))
+            .all()
+        }
+        missing_templates = [t for t in templates if t['name'] not in existing]
+        
+        if missing_templates:
+            db.session.bulk_insert_mappings(ResumeTemplate, missing_templates)
         
         db.session.commit()
-        logger.info(f"Created {len(templates)} default resume templates")
+        logger.info(f"Created {len(missing_templates)} default resume templates")
         
     except Exception as e:
         logger.error(f"Failed to create default templates: {str(e)}")
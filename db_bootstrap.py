@@ -0,0 +1,96 @@
+"""
+Shared database handles for the setup and maintenance scripts
+Each handle is created once per process so chained scripts reuse the same driver import and connections
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+from pymysql.constants import CLIENT
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import URL
+from sqlalchemy.pool import QueuePool
+
+from config import Config
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / 'migrations'
+# Last revision before companies.legal_name_g was added by migration
+PRE_LEGAL_NAME_REVISION = 'a4d2c7e91b3f'
+
+@lru_cache(maxsize=1)
+def engine():
+    """Engine bound to the application database"""
+    return create_engine(Config.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True, pool_size=2)
+
+@lru_cache(maxsize=1)
+def server_engine():
+    """Server-level engine (no default schema) used to create the database itself"""
+    url = URL.create(
+        'mysql+pymysql',
+        username=Config.MYSQL_USER,
+        password=Config.MYSQL_PASSWORD,
+        host=Config.MYSQL_HOST,
+        query={'charset': 'utf8mb4'}
+    )
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=2,
+        pool_pre_ping=True,
+        # Lets a whole bootstrap DDL script go to the server in one round-trip
+        connect_args={'client_flag': CLIENT.MULTI_STATEMENTS}
+    )
+
+@lru_cache(maxsize=1)
+def migration_app():
+    """Bare Flask app carrying only the db and Flask-Migrate extensions, for running Alembic"""
+    from flask import Flask
+    from flask_migrate import Migrate
+    from app import db
+    
+    app = Flask('traintiq_migrations')
+    app.config.from_object(Config)
+    db.init_app(app)
+    Migrate(app, db, directory=str(MIGRATIONS_DIR))
+    return app
+
+class LegacySchemaError(RuntimeError):
+    """Raised when a populated legacy companies table would be migrated without being asked to"""
+
+def upgrade_schema(migrate_legacy=False):
+    """Bring the companies schema to the Alembic head revision
+    
+    Alembic records the applied revision in alembic_version, so once the database is
+    current this costs a single version lookup. A database whose companies table was
+    created in its current shape (from the models or schema/companies.sql, keyed by id,
+    no alembic_version) is stamped at head instead of replaying the legacy migrations.
+    
+    A legacy _id-keyed companies table that holds rows is only migrated when
+    migrate_legacy is set, so re-running a setup script never rewrites it unprompted.
+    """
+    from flask_migrate import stamp, upgrade
+    from app import db
+    
+    with migration_app().app_context():
+        inspector = inspect(db.engine)
+        columns = (
+            {column['name'] for column in inspector.get_columns('companies')}
+            if inspector.has_table('companies') else set()
+        )
+        if '_id' in columns and not migrate_legacy:
+            with db.engine.connect() as connection:
+                populated = connection.execute(text("SELECT 1 FROM companies LIMIT 1")).first()
+            if populated:
+                raise LegacySchemaError(
+                    "companies still has the legacy _id layout and holds data; back it up, then "
+                    "migrate it with 'flask db upgrade' or upgrade_schema(migrate_legacy=True)"
+                )
+        if inspector.has_table('alembic_version') or '_id' in columns:
+            upgrade(directory=str(MIGRATIONS_DIR))
+        elif columns and 'legal_name_g' not in columns:
+            # Keyed by id but created before the legal-name column: stamp the revision that
+            # shape matches and let the remaining migrations add it
+            stamp(directory=str(MIGRATIONS_DIR), revision=PRE_LEGAL_NAME_REVISION)
+            upgrade(directory=str(MIGRATIONS_DIR))
+        else:
+            stamp(directory=str(MIGRATIONS_DIR))
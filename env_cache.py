@@ -0,0 +1,55 @@
+"""
+Cached environment loader for the setup and maintenance scripts
+Parses the env files once per process and returns a read-only merged view,
+and prompts for missing values only when running on an interactive terminal
+"""
+
+import getpass
+import os
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# Later files override earlier ones; real environment variables override all files
+ENV_FILES = ('.env', 'config.env', 'config.env.local')
+
+# One pass classifies an OpenAI key: template placeholders first, then the real key shape
+OPENAI_KEY_RX = re.compile(r'(?P<placeholder>.*(?:placeholder|your_openai).*)|(?P<valid>sk-[A-Za-z0-9_-]{20,})')
+
+@lru_cache(maxsize=1)
+def load_env() -> Mapping[str, str]:
+    """Return env file values merged with os.environ, parsed only on first call"""
+    # Imported here so scripts that never read the env files don't pay for it
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        return MappingProxyType(dict(os.environ))
+    
+    merged = {}
+    for name in ENV_FILES:
+        path = BASE_DIR / name
+        if path.exists():
+            merged.update({k: v for k, v in dotenv_values(path).items() if v is not None})
+    merged.update(os.environ)
+    return MappingProxyType(merged)
+
+def classify_openai_key(key) -> str:
+    """Classify an OpenAI key as 'valid', 'placeholder', 'empty' or 'malformed'"""
+    if not key:
+        return 'empty'
+    match = OPENAI_KEY_RX.fullmatch(key)
+    return match.lastgroup if match else 'malformed'
+
+def ask(value, prompt, default='', secret=False):
+    """Return value if already given, else prompt on an interactive terminal, else the default"""
+    if value:
+        return value
+    if not sys.stdin.isatty():
+        return default
+    answer = (getpass.getpass if secret else input)(prompt).strip()
+    return answer or default
@@ -1,56 +1,76 @@
-from app import create_app, db
-import pymysql
+import hashlib
+from pathlib import Path
+from sqlalchemy import text
+from app import db
+from app.models import chat, company  # noqa: F401 - registers the app tables on db.metadata
 from config import Config
+from db_bootstrap import server_engine, upgrade_schema
+
+SCHEMA_DIR = Path(__file__).resolve().parent / 'schema'
+
+def load_schema(name):
+    """Return the DDL script for a table and its checksum"""
+    ddl = (SCHEMA_DIR / f'{name}.sql').read_bytes()
+    return ddl.decode('utf-8'), hashlib.sha256(ddl).hexdigest()
+
+def companies_table_intact(connection):
+    """Whether the companies table exists with the legal-name column and index from the DDL script"""
+    has_column, has_index = connection.execute(text(
+        "SELECT "
+        "(SELECT COUNT(*) FROM information_schema.columns WHERE table_schema = DATABASE() "
+        "AND table_name = 'companies' AND column_name = 'legal_name_g'), "
+        "(SELECT COUNT(*) FROM information_schema.statistics WHERE table_schema = DATABASE() "
+        "AND table_name = 'companies' AND index_name = 'idx_companies_legal_name')"
+    )).one()
+    return bool(has_column and has_index)
 
 def init_database():
-    # First, create the database if it doesn't exist
-    connection = pymysql.connect(
-        host=Config.MYSQL_HOST,
-        user=Config.MYSQL_USER,
-        password=Config.MYSQL_PASSWORD
-    )
+    engine = server_engine()
+    companies_ddl, companies_sha = load_schema('companies')
     try:
-        with connection.cursor() as cursor:
-            # Create database
-            cursor.execute(f'CREATE DATABASE IF NOT EXISTS {Config.MYSQL_DB}')
+        with engine.begin() as connection:
+            # Create the database and the schema bookkeeping table in one batch
+            connection.exec_driver_sql(f"""
+                CREATE DATABASE IF NOT EXISTS {Config.MYSQL_DB}
+                    CHARACTER SET utf8mb4 COLLATE utf8mb4_0900_ai_ci;
+                USE {Config.MYSQL_DB};
+                CREATE TABLE IF NOT EXISTS schema_meta (
+                    name VARCHAR(64) PRIMARY KEY,
+                    sha CHAR(64) NOT NULL,
+                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                );
+            """)
             print(f"✅ Database '{Config.MYSQL_DB}' created or already exists")
             
-            # Switch to the database
-            cursor.execute(f'USE {Config.MYSQL_DB}')
-            
-            # Create companies table with JSON columns
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS companies (
-                    _id VARCHAR(24) PRIMARY KEY,
-                    basicInfo JSON,
-                    operational JSON,
-                    contact JSON,
-                    financials JSON,
-                    descriptive JSON,
-                    relationships JSON,
-                    governance JSON,
-                    digitalPresence JSON,
-                    scrapedData JSON,
-                    meta_info JSON,
-                    customSections JSON
+            # Only send the companies DDL when the script changed since it was last applied and the
+            # table still has the shape it created: setup_db/reset_db rebuild companies from the model
+            # without touching schema_meta, so the stored checksum alone can't be trusted
+            applied_sha = connection.execute(
+                text("SELECT sha FROM schema_meta WHERE name = :name"), {'name': 'companies'}
+            ).scalar()
+            if applied_sha == companies_sha and companies_table_intact(connection):
+                print("✅ Companies table is up to date")
+            else:
+                connection.exec_driver_sql(companies_ddl)
+                connection.execute(
+                    text("REPLACE INTO schema_meta (name, sha) VALUES (:name, :sha)"),
+                    {'name': 'companies', 'sha': companies_sha}
                 )
-            """)
-            print("✅ Companies table created!")
+                print("✅ Companies table created or already present!")
+            
+            # Create the remaining model tables over the same connection
+            db.metadata.create_all(
+                connection.execution_options(schema_translate_map={None: Config.MYSQL_DB}),
+                checkfirst=True
+            )
+            print("✅ SQLAlchemy setup complete!")
+        
+        # Stamp a freshly created schema at head, or migrate a legacy _id-keyed companies table
+        upgrade_schema()
+        print("✅ Migrations applied!")
             
     except Exception as e:
         print(f"❌ Error setting up database: {e}")
-        return
-    finally:
-        connection.close()
-
-    # Initialize Flask app context
-    app = create_app()
-    with app.app_context():
-        try:
-            db.create_all()
-            print("✅ SQLAlchemy setup complete!")
-        except Exception as e:
-            print(f"❌ Error with SQLAlchemy setup: {e}")
 
 if __name__ == "__main__":
-    init_database() 
\ No newline at end of file
+    init_database()
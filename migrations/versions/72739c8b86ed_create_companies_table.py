@@ -19,8 +19,14 @@ depends_on = None
 def upgrade():
     # ### commands auto generated by Alembic - please adjust! ###
     with op.batch_alter_table('companies', schema=None) as batch_op:
-        batch_op.add_column(sa.Column('id', sa.String(length=24), nullable=False))
+        batch_op.add_column(sa.Column('id', sa.String(length=24), nullable=True))
         batch_op.add_column(sa.Column('metaInfo', sa.JSON(), nullable=True))
+
+    # Carry existing rows over to the renamed columns before the old ones are dropped
+    op.execute("UPDATE companies SET id = _id, metaInfo = meta_info")
+
+    with op.batch_alter_table('companies', schema=None) as batch_op:
+        batch_op.alter_column('id', existing_type=sa.String(length=24), nullable=False)
         batch_op.drop_column('_id')
         batch_op.drop_column('meta_info')
 
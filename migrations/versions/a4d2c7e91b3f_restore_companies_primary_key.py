@@ -0,0 +1,29 @@
+"""restore_companies_primary_key
+
+Revision ID: a4d2c7e91b3f
+Revises: f150f7d2b888
+Create Date: 2026-10-16 18:02:11.514207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4d2c7e91b3f'
+down_revision = 'f150f7d2b888'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 72739c8b86ed replaced the _id primary key with a plain id column; key the table by id again
+    # unless it already is (tables created from the current schema/companies.sql)
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.get_pk_constraint('companies')['constrained_columns']:
+        op.create_primary_key('pk_companies', 'companies', ['id'])
+
+
+def downgrade():
+    # upgrade() only adds the key when it was missing, and tables created keyed by id must keep it
+    pass
@@ -0,0 +1,38 @@
+"""add_companies_legal_name_index
+
+Revision ID: c8e5f1a37d06
+Revises: a4d2c7e91b3f
+Create Date: 2026-10-16 18:40:27.093118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c8e5f1a37d06'
+down_revision = 'a4d2c7e91b3f'
+branch_labels = None
+depends_on = None
+
+LEGAL_NAME_EXPR = "IF(JSON_VALID(basicInfo), JSON_UNQUOTE(JSON_EXTRACT(basicInfo, '$.legalName')), NULL)"
+
+
+def upgrade():
+    # Tables bootstrapped from the old DDL already carry legal_name_g; redefine it so it tolerates
+    # non-JSON TEXT, and add it (and its index) to tables created before it existed
+    inspector = sa.inspect(op.get_bind())
+    columns = {column['name'] for column in inspector.get_columns('companies')}
+    indexes = {index['name'] for index in inspector.get_indexes('companies')}
+    if 'idx_companies_legal_name' in indexes:
+        op.drop_index('idx_companies_legal_name', table_name='companies')
+    if 'legal_name_g' in columns:
+        op.drop_column('companies', 'legal_name_g')
+    op.add_column('companies', sa.Column('legal_name_g', sa.String(length=255),
+                                         sa.Computed(LEGAL_NAME_EXPR, persisted=True), nullable=True))
+    op.create_index('idx_companies_legal_name', 'companies', ['legal_name_g'], unique=False)
+
+
+def downgrade():
+    # Bootstrapped tables had legal_name_g before this revision, so leave the column and index in place
+    pass
@@ -1,3 +1,4 @@
+import os
 from waitress import serve
 from app import create_app
 from config import Config
@@ -5,6 +6,20 @@ from config import Config
 app = create_app(Config)
 
 if __name__ == '__main__':
+    host = os.getenv('HOST', '0.0.0.0')
+    port = int(os.getenv('PORT', '8000'))
+    threads = int(os.getenv('WAITRESS_THREADS', '16'))
+    connection_limit = int(os.getenv('WAITRESS_CONN_LIMIT', '1000'))
+    channel_timeout = int(os.getenv('WAITRESS_CHANNEL_TIMEOUT', '120'))
+
     print('Starting production server...')
-    print('Server will be available at: http://localhost:8000')
-    serve(app, host='0.0.0.0', port=8000, threads=4) 
\ No newline at end of file
+    print(f'Server will be available at: http://localhost:{port} ({threads} threads)')
+    serve(
+        app,
+        host=host,
+        port=port,
+        threads=threads,
+        connection_limit=connection_limit,
+        channel_timeout=channel_timeout,
+        asyncore_use_poll=True  # poll() instead of select(): no 1024-fd cap, no O(n) fd scan
+    )
\ No newline at end of file
@@ -4,12 +4,17 @@ Quick fix script for TraintiQ configuration issues
 This will help you resolve the OpenAI API and database connection problems
 """
 
-import os
-import sys
+import re
 from pathlib import Path
 
-def fix_configuration():
-    """Fix common configuration issues"""
+# env_cache only pulls in the standard library; dotenv, openai, sqlalchemy and config are
+# imported inside the functions that need them so the default fix path starts fast
+from env_cache import ask, classify_openai_key, load_env
+
+OPENAI_KEY_LINE = re.compile(r'^OPENAI_API_KEY=.*$', re.MULTILINE)
+
+def fix_configuration(openai_key=None):
+    """Fix common configuration issues (openai_key skips the interactive key prompt)"""
     
     print("🔧 TraintiQ Quick Configuration Fix")
     print("=" * 40)
@@ -21,23 +26,19 @@ def fix_configuration():
     print(f"📁 Using config file: {config_file}")
     
     # Read current config
-    current_config = {}
-    if config_file.exists():
-        with open(config_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    current_config[key] = value
+    current_config = load_env()
     
     print("\n🔍 Current Issues Detected:")
     
     # Check OpenAI API Key
-    openai_key = current_config.get('OPENAI_API_KEY', '')
-    if not openai_key or 'placeholder' in openai_key or 'your_openai' in openai_key:
-        print("❌ OpenAI API Key: Not configured (shows as 'unavailable')")
-    else:
-        print("✅ OpenAI API Key: Configured")
+    current_key = current_config.get('OPENAI_API_KEY', '')
+    match classify_openai_key(current_key):
+        case 'valid':
+            print("✅ OpenAI API Key: Configured")
+        case 'malformed':
+            print("❌ OpenAI API Key: Invalid format (keys start with 'sk-')")
+        case _:
+            print("❌ OpenAI API Key: Not configured (shows as 'unavailable')")
     
     # Check Database
     db_url = current_config.get('DATABASE_URL', '')
@@ -60,27 +61,23 @@ def fix_configuration():
     print("   - Restart your Flask server")
     print("   - Visit: http://localhost:5000/api/chat/health")
     
-    # Option to interactively set API key
+    # Option to set API key, either passed in or entered interactively
     print("\n" + "="*40)
-    update = input("Would you like to set your OpenAI API key now? (y/n): ").lower().strip()
+    update = 'y' if openai_key else ask(None, "Would you like to set your OpenAI API key now? (y/n): ", 'n').lower()
     
     if update == 'y':
         print("\n🔑 Setting OpenAI API Key:")
-        api_key = input("Enter your OpenAI API key (starts with 'sk-'): ").strip()
+        api_key = ask(openai_key, "Enter your OpenAI API key (starts with 'sk-', input will be hidden): ", secret=True)
         
-        if api_key and api_key.startswith('sk-'):
-            # Update config file
-            lines_to_write = []
-            
-            with open(config_file, 'r') as f:
-                for line in f:
-                    if line.startswith('OPENAI_API_KEY='):
-                        lines_to_write.append(f'OPENAI_API_KEY={api_key}\n')
-                    else:
-                        lines_to_write.append(line)
-            
-            with open(config_file, 'w') as f:
-                f.writelines(lines_to_write)
+        if classify_openai_key(api_key) == 'valid':
+            # Update config file in a single read/modify/write
+            text = config_file.read_text() if config_file.exists() else ''
+            new_line = f'OPENAI_API_KEY={api_key}'
+            updated, replaced = OPENAI_KEY_LINE.subn(lambda _: new_line, text)
+            if not replaced:
+                separator = '' if not text or text.endswith('\n') else '\n'
+                updated = f"{text}{separator}{new_line}\n"
+            config_file.write_text(updated)
             
             print("✅ OpenAI API key updated successfully!")
             print("🔄 Please restart your Flask server to apply changes")
@@ -101,13 +98,11 @@ def check_current_status():
     print("=" * 30)
     
     # Load environment
-    from dotenv import load_dotenv
-    load_dotenv()
-    load_dotenv('config.env')
+    env = load_env()
     
     # Check OpenAI
-    openai_key = os.getenv('OPENAI_API_KEY', '')
-    if openai_key and openai_key.startswith('sk-') and 'placeholder' not in openai_key:
+    openai_key = env.get('OPENAI_API_KEY', '')
+    if classify_openai_key(openai_key) == 'valid':
         print("✅ OpenAI API Key: Configured")
         
         # Test API connection
@@ -127,23 +122,29 @@ def check_current_status():
     
     # Check Database
     try:
-        from flask import Flask
-        from flask_sqlalchemy import SQLAlchemy
         from config import Config
-        from sqlalchemy import text
-        
-        app = Flask(__name__)
-        app.config.from_object(Config)
-        db = SQLAlchemy(app)
+        from sqlalchemy import create_engine, text
         
-        with app.app_context():
-            db.session.execute(text('SELECT 1'))
-            print("✅ Database: Connection successful")
+        # A bare engine is enough for a health probe - no Flask app or model metadata needed
+        engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+        try:
+            with engine.connect() as connection:
+                connection.execute(text('SELECT 1'))
+                print("✅ Database: Connection successful")
+        finally:
+            engine.dispose()
     except Exception as e:
         print(f"❌ Database: Connection failed - {str(e)}")
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1 and sys.argv[1] == 'check':
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="TraintiQ quick configuration fix")
+    parser.add_argument('command', nargs='?', choices=['fix', 'check'], default='fix')
+    parser.add_argument('--openai-key', help="write this key to config.env without prompting")
+    args = parser.parse_args()
+    
+    if args.command == 'check':
         check_current_status()
     else:
-        fix_configuration() 
\ No newline at end of file
+        fix_configuration(openai_key=args.openai_key)
@@ -1,24 +1,44 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
 
-def reset_database():
-    """Reset the database by dropping and recreating all tables"""
-    url = "http://localhost:5000/api/companies/db/reset"
+RESET_URL = "http://localhost:5000/api/companies/db/reset"
+
+# Module-level session so repeated resets reuse the same keep-alive connection
+_SESSION = requests.Session()
+_SESSION.headers.update({'Accept': 'application/json', 'Connection': 'keep-alive'})
+_SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+def reset_database_via_api():
+    """Reset the database through the running server's /db/reset endpoint"""
     try:
-        response = requests.post(url)
+        response = _SESSION.post(RESET_URL, timeout=(2, 30))
         print(f"Status Code: {response.status_code}")
-        
+
         try:
             result = response.json()
             print("\nResponse:")
             print(f"Status: {result.get('status', 'unknown')}")
             print(f"Message: {result.get('message', 'No message provided')}")
-        except json.JSONDecodeError:
+        except ValueError:
             print("\nRaw Response:")
             print(response.text)
-            
+
     except requests.RequestException as e:
         print(f"Error: {str(e)}")
 
+def reset_database():
+    """Reset the database by dropping and recreating all tables, directly over the DB connection"""
+    from setup_db import setup_database
+    return setup_database()
+
 if __name__ == "__main__":
-    reset_database() 
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Drop and recreate the TraintiQ tables")
+    parser.add_argument('--http', action='store_true', help="go through the running server's reset endpoint")
+    args = parser.parse_args()
+    
+    if args.http:
+        reset_database_via_api()
+    else:
+        reset_database()
\ No newline at end of file
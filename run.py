@@ -1,11 +1,15 @@
+import os
 from app import create_app
 from config import Config
 
 app = create_app(Config)
 
 if __name__ == '__main__':
+    debug = os.getenv('FLASK_DEBUG', '0').lower() in ('1', 'true')
     app.run(
         host='0.0.0.0',  # Makes the server externally visible
-        port=5000,       # Port 5000 is Flask's default
-        debug=True       # Enable debug mode for development
+        port=int(os.getenv('PORT', '5000')),  # Port 5000 is Flask's default
+        debug=debug,     # FLASK_DEBUG=1/True enables debug mode for development
+        use_reloader=debug and os.getenv('RELOAD', '1') == '1',  # RELOAD=0 keeps debug without the reloader
+        threaded=True    # Serve each request in its own thread
     )
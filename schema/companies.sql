@@ -0,0 +1,19 @@
+-- Companies table in the shape of app.models.company.Company, created by init_db.py
+-- Profile columns are TEXT holding JSON, so the generated column only parses valid JSON
+CREATE TABLE IF NOT EXISTS companies (
+    id VARCHAR(24) NOT NULL PRIMARY KEY,
+    basicInfo TEXT,
+    operational TEXT,
+    contact TEXT,
+    financials TEXT,
+    descriptive TEXT,
+    relationships TEXT,
+    governance TEXT,
+    digitalPresence TEXT,
+    scrapedData TEXT,
+    metaInfo TEXT,
+    customSections TEXT,
+    legal_name_g VARCHAR(255)
+        AS (IF(JSON_VALID(basicInfo), JSON_UNQUOTE(JSON_EXTRACT(basicInfo, '$.legalName')), NULL)) STORED,
+    INDEX idx_companies_legal_name (legal_name_g)
+) DEFAULT CHARSET = utf8mb4 COLLATE = utf8mb4_0900_ai_ci;
@@ -1,22 +1,57 @@
-from app import create_app, db
+from sqlalchemy import insert
+from app import db
+from app.models import chat, company  # noqa: F401 - registers the app tables on db.metadata
+from app.models.company import Company, generate_company_id, process_json_dates
+from app.core.json_provider import dumps_text
+from db_bootstrap import engine, upgrade_schema
+
+# Profile sections stored as JSON text on the companies table
+# Profile columns only: the id is generated and MySQL computes legal_name_g itself
+COMPANY_SECTIONS = [
+    column.name for column in Company.__table__.columns
+    if column.name != 'id' and column.computed is None
+]
 
 def setup_database():
     """Setup the database by dropping and recreating all tables"""
-    app = create_app()
-    
-    with app.app_context():
-        try:
+    try:
+        with engine().begin() as connection:
             print("Dropping all tables...")
-            db.drop_all()
+            db.metadata.drop_all(connection)
             print("Creating all tables...")
-            db.create_all()
-            print("Database setup completed successfully!")
-        except Exception as e:
-            print(f"Error: {e}")
-            print("\nPossible solutions:")
-            print("1. Make sure MySQL server is running")
-            print("2. Check if the username and password in config.py are correct")
-            print("3. Verify that MySQL is running on the specified port (default: 3306)")
+            db.metadata.create_all(connection)
+        # The fresh tables match the models, so this only stamps or confirms the Alembic head
+        upgrade_schema()
+        print("Database setup completed successfully!")
+        return True
+    except Exception as e:
+        print(f"Error: {e}")
+        print("\nPossible solutions:")
+        print("1. Make sure MySQL server is running")
+        print("2. Check if the username and password in config.py are correct")
+        print("3. Verify that MySQL is running on the specified port (default: 3306)")
+        return False
+
+def _company_row(data):
+    """Normalize a company dict into a full row of JSON text columns"""
+    if "metadata" in data:
+        data = {**data, "metaInfo": data["metadata"]}
+    row = {'id': data.get('id') or data.get('_id') or generate_company_id()}
+    for section in COMPANY_SECTIONS:
+        value = data.get(section)
+        if isinstance(value, (dict, list)):
+            value = dumps_text(process_json_dates(value, for_storage=True))
+        row[section] = value if value is not None else '{}'
+    return row
+
+def seed_companies(companies):
+    """Insert company dicts with a single executemany, bypassing the ORM unit of work"""
+    rows = [_company_row(data) for data in companies]
+    if not rows:
+        return 0
+    with engine().begin() as connection:
+        connection.execute(insert(Company), rows)
+    return len(rows)
 
 if __name__ == "__main__":
-    setup_database() 
\ No newline at end of file
+    setup_database()
@@ -5,11 +5,14 @@ This script helps you safely configure your OpenAI API key and other environment
 """
 
 import os
+import sys
 import getpass
 from pathlib import Path
 
-def setup_environment():
-    """Setup environment variables securely"""
+from env_cache import ask, classify_openai_key
+
+def setup_environment(args):
+    """Setup environment variables securely (missing values are prompted for on a terminal)"""
     
     print("🔐 TraintiQ Chat Bot - Secure Environment Setup")
     print("=" * 50)
@@ -21,10 +24,10 @@ def setup_environment():
     # Check if .env file exists
     if env_file.exists():
         print(f"✅ Found existing .env file at: {env_file}")
-        overwrite = input("Do you want to update the existing .env file? (y/n): ").lower().strip()
+        overwrite = 'y' if args.yes else ask(None, "Do you want to update the existing .env file? (y/n): ", 'n').lower()
         if overwrite != 'y':
-            print("Setup cancelled.")
-            return
+            print("Setup cancelled. Pass --yes to overwrite without prompting.")
+            return False
     else:
         print(f"📝 Creating new .env file at: {env_file}")
     
@@ -35,27 +38,33 @@ def setup_environment():
     print("-" * 30)
     
     # Get OpenAI API key securely
+    api_key = ask(args.openai_key, "Enter your OpenAI API key (input will be hidden): ", secret=True)
     while True:
-        api_key = getpass.getpass("Enter your OpenAI API key (input will be hidden): ").strip()
-        if api_key:
-            if api_key.startswith('sk-'):
+        match classify_openai_key(api_key):
+            case 'valid':
                 env_vars['OPENAI_API_KEY'] = api_key
                 print("✅ OpenAI API key added")
                 break
-            else:
+            case 'empty':
+                print("❌ API key cannot be empty")
+            case 'placeholder':
+                print("❌ That looks like a placeholder, not a real API key")
+            case _:
                 print("❌ Invalid API key format. OpenAI keys start with 'sk-'")
-        else:
-            print("❌ API key cannot be empty")
+        if not sys.stdin.isatty():
+            print("Pass a valid key with --openai-key or OPENAI_API_KEY.")
+            return False
+        api_key = getpass.getpass("Enter your OpenAI API key (input will be hidden): ").strip()
     
     print("\n🗄️ Database Configuration")
     print("-" * 30)
     
     # Database URL
-    db_host = input("Database host [localhost]: ").strip() or "localhost"
-    db_port = input("Database port [3306]: ").strip() or "3306"
-    db_user = input("Database username: ").strip()
-    db_password = getpass.getpass("Database password (input will be hidden): ").strip()
-    db_name = input("Database name [traintiq_db]: ").strip() or "traintiq_db"
+    db_host = ask(args.db_host, "Database host [localhost]: ", "localhost")
+    db_port = ask(args.db_port, "Database port [3306]: ", "3306")
+    db_user = ask(args.db_user, "Database username: ")
+    db_password = ask(args.db_password, "Database password (input will be hidden): ", secret=True)
+    db_name = ask(args.db_name, "Database name [traintiq_db]: ", "traintiq_db")
     
     if db_user and db_password:
         env_vars['DATABASE_URL'] = f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
@@ -65,11 +74,10 @@ def setup_environment():
     print("-" * 30)
     
     # Flask environment
-    flask_env = input("Flask environment [development]: ").strip() or "development"
-    env_vars['FLASK_ENV'] = flask_env
+    env_vars['FLASK_ENV'] = ask(args.flask_env, "Flask environment [development]: ", "development")
     
     # Secret key
-    secret_key = input("Secret key (leave empty to generate): ").strip()
+    secret_key = ask(args.secret_key, "Secret key (leave empty to generate): ")
     if not secret_key:
         import secrets
         secret_key = secrets.token_urlsafe(32)
@@ -77,47 +85,46 @@ def setup_environment():
     env_vars['SECRET_KEY'] = secret_key
     
     # CORS origins
-    cors_origins = input("CORS origins [http://localhost:4200]: ").strip() or "http://localhost:4200"
-    env_vars['CORS_ORIGINS'] = cors_origins
+    env_vars['CORS_ORIGINS'] = ask(args.cors_origins, "CORS origins [http://localhost:4200]: ", "http://localhost:4200")
     
     # Log level
-    log_level = input("Log level [INFO]: ").strip() or "INFO"
-    env_vars['LOG_LEVEL'] = log_level
-    
-    # Write to .env file
+    env_vars['LOG_LEVEL'] = ask(args.log_level, "Log level [INFO]: ", "INFO")
+    
+    # Build the whole file in memory so it can be written in one go
+    database_section = (
+        f"# Database Configuration\nDATABASE_URL={env_vars['DATABASE_URL']}\n\n"
+        if 'DATABASE_URL' in env_vars else ""
+    )
+    content = (
+        "# TraintiQ Chat Bot Environment Configuration\n"
+        "# Generated automatically - DO NOT COMMIT THIS FILE\n\n"
+        f"# OpenAI Configuration\nOPENAI_API_KEY={env_vars['OPENAI_API_KEY']}\n\n"
+        f"{database_section}"
+        f"# Flask Configuration\nFLASK_ENV={env_vars['FLASK_ENV']}\nSECRET_KEY={env_vars['SECRET_KEY']}\n\n"
+        f"# CORS Configuration\nCORS_ORIGINS={env_vars['CORS_ORIGINS']}\n\n"
+        f"# Logging\nLOG_LEVEL={env_vars['LOG_LEVEL']}\n"
+    )
+    
+    # Write to a temp file and rename over .env so a crash never leaves it half-written
+    tmp_file = env_file.with_name('.env.tmp')
     try:
-        with open(env_file, 'w') as f:
-            f.write("# TraintiQ Chat Bot Environment Configuration\n")
-            f.write("# Generated automatically - DO NOT COMMIT THIS FILE\n\n")
-            
-            f.write("# OpenAI Configuration\n")
-            f.write(f"OPENAI_API_KEY={env_vars['OPENAI_API_KEY']}\n\n")
-            
-            if 'DATABASE_URL' in env_vars:
-                f.write("# Database Configuration\n")
-                f.write(f"DATABASE_URL={env_vars['DATABASE_URL']}\n\n")
-            
-            f.write("# Flask Configuration\n")
-            f.write(f"FLASK_ENV={env_vars['FLASK_ENV']}\n")
-            f.write(f"SECRET_KEY={env_vars['SECRET_KEY']}\n\n")
-            
-            f.write("# CORS Configuration\n")
-            f.write(f"CORS_ORIGINS={env_vars['CORS_ORIGINS']}\n\n")
-            
-            f.write("# Logging\n")
-            f.write(f"LOG_LEVEL={env_vars['LOG_LEVEL']}\n")
+        # Create the temp file owner-only (Unix-like systems) so the secrets are never readable by
+        # others; a stale temp file is removed first because O_CREAT keeps an existing file's mode
+        tmp_file.unlink(missing_ok=True)
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        os.replace(tmp_file, env_file)
         
         print(f"\n✅ Environment file created successfully!")
         print(f"📁 Location: {env_file}")
-        
-        # Set proper file permissions (Unix-like systems)
-        if os.name != 'nt':  # Not Windows
-            os.chmod(env_file, 0o600)  # Read/write for owner only
+        if os.name != 'nt':
             print("🔒 File permissions set to owner-only access")
         
     except Exception as e:
+        tmp_file.unlink(missing_ok=True)
         print(f"❌ Error creating .env file: {str(e)}")
-        return
+        return False
     
     print("\n🔒 Security Recommendations")
     print("-" * 30)
@@ -134,9 +141,10 @@ def setup_environment():
     print("3. Test the chat API at: http://localhost:5000/api/chat/health")
     
     print("\n🎉 Setup complete! Your chat bot is ready to use GPT-4!")
+    return True
 
-def verify_setup():
-    """Verify the environment setup"""
+def verify_setup(full=False):
+    """Verify the environment setup (full=True also runs a chat completion)"""
     
     print("\n🔍 Verifying Environment Setup")
     print("-" * 30)
@@ -155,7 +163,7 @@ def verify_setup():
     
     # Check OpenAI API key
     api_key = os.getenv('OPENAI_API_KEY')
-    if api_key and api_key.startswith('sk-'):
+    if classify_openai_key(api_key) == 'valid':
         print("✅ OpenAI API key configured")
     else:
         print("❌ OpenAI API key not configured or invalid")
@@ -168,19 +176,23 @@ def verify_setup():
     else:
         print("⚠️  Database URL not configured")
     
-    # Test OpenAI connection
+    # Test OpenAI connection - listing models is a cheap authenticated call,
+    # the chat completion only runs when a full check is requested
     try:
         from openai import OpenAI
         client = OpenAI(api_key=api_key)
         
-        # Make a simple test request
-        response = client.chat.completions.create(
-            model="gpt-4-turbo-preview",
-            messages=[{"role": "user", "content": "Test"}],
-            max_tokens=5
-        )
-        print("✅ OpenAI API connection successful")
-        print(f"✅ Using model: gpt-4-turbo-preview")
+        client.models.list()
+        print("✅ OpenAI API key accepted")
+        
+        if full:
+            client.chat.completions.create(
+                model="gpt-4-turbo-preview",
+                messages=[{"role": "user", "content": "Test"}],
+                max_tokens=5
+            )
+            print("✅ OpenAI API connection successful")
+            print(f"✅ Using model: gpt-4-turbo-preview")
         
     except Exception as e:
         print(f"❌ OpenAI API connection failed: {str(e)}")
@@ -190,15 +202,34 @@ def verify_setup():
     return True
 
 if __name__ == "__main__":
-    import sys
-    
-    if len(sys.argv) > 1 and sys.argv[1] == 'verify':
-        verify_setup()
-    else:
-        setup_environment()
-        
-        # Ask if user wants to verify
-        print()
-        verify = input("Do you want to verify the setup now? (y/n): ").lower().strip()
-        if verify == 'y':
-            verify_setup() 
\ No newline at end of file
+    import argparse
+    
+    # Every prompt can be answered up front so the script also runs unattended (CI, containers)
+    parser = argparse.ArgumentParser(description="TraintiQ environment setup")
+    parser.add_argument('command', nargs='?', choices=['setup', 'verify'], default='setup')
+    parser.add_argument('--full', action='store_true', help="also run a chat completion when verifying")
+    parser.add_argument('--verify', action='store_true', help="verify right after setup without asking")
+    parser.add_argument('--yes', '-y', action='store_true', help="overwrite an existing .env without asking")
+    parser.add_argument('--openai-key', default=os.getenv('OPENAI_API_KEY'))
+    parser.add_argument('--db-host', default=os.getenv('MYSQL_HOST'))
+    parser.add_argument('--db-port', default=os.getenv('MYSQL_PORT'))
+    parser.add_argument('--db-user', default=os.getenv('MYSQL_USER'))
+    parser.add_argument('--db-password', default=os.getenv('MYSQL_PASSWORD'))
+    parser.add_argument('--db-name', default=os.getenv('MYSQL_DATABASE'))
+    parser.add_argument('--flask-env', default=os.getenv('FLASK_ENV'))
+    parser.add_argument('--secret-key', default=os.getenv('SECRET_KEY'))
+    parser.add_argument('--cors-origins', default=os.getenv('CORS_ORIGINS'))
+    parser.add_argument('--log-level', default=os.getenv('LOG_LEVEL'))
+    args = parser.parse_args()
+    
+    if args.command == 'verify':
+        sys.exit(0 if verify_setup(full=args.full) else 1)
+    
+    if not setup_environment(args):
+        sys.exit(1)
+    
+    # Ask if user wants to verify
+    print()
+    verify = 'y' if args.verify else ask(None, "Do you want to verify the setup now? (y/n): ", 'n').lower()
+    if verify == 'y':
+        verify_setup(full=args.full)
@@ -4,26 +4,29 @@ MySQL Database Setup Script for TraintiQ
 This script will create the MySQL database and test the connection
 """
 
-import os
 import sys
-import mysql.connector
-from dotenv import load_dotenv
+import pymysql
 
-def setup_mysql_database():
+from env_cache import load_env
+
+def mysql_settings(host=None, user=None, password=None, database=None):
+    """Resolve MySQL settings: explicit values first, then the env files, then defaults"""
+    env = load_env()
+    return (
+        host or env.get('MYSQL_HOST', 'localhost'),
+        user or env.get('MYSQL_USER', 'root'),
+        password or env.get('MYSQL_PASSWORD', 'lenacjnv7'),
+        database or env.get('MYSQL_DATABASE', 'traintiq_db'),
+    )
+
+def setup_mysql_database(**overrides):
     """Setup MySQL database for TraintiQ"""
     
     print("🗄️ TraintiQ MySQL Database Setup")
     print("=" * 40)
     
-    # Load environment variables
-    load_dotenv()
-    load_dotenv('config.env')
-    
     # Get MySQL configuration
-    mysql_host = os.getenv('MYSQL_HOST', 'localhost')
-    mysql_user = os.getenv('MYSQL_USER', 'root')
-    mysql_password = os.getenv('MYSQL_PASSWORD', 'lenacjnv7')
-    mysql_database = os.getenv('MYSQL_DATABASE', 'traintiq_db')
+    mysql_host, mysql_user, mysql_password, mysql_database = mysql_settings(**overrides)
     
     print(f"📊 Database Configuration:")
     print(f"  Host: {mysql_host}")
@@ -35,10 +38,11 @@ def setup_mysql_database():
         # Connect to MySQL server (without specifying database)
         print("\n🔌 Connecting to MySQL server...")
         
-        connection = mysql.connector.connect(
+        connection = pymysql.connect(
             host=mysql_host,
             user=mysql_user,
-            password=mysql_password
+            password=mysql_password,
+            charset='utf8mb4'
         )
         
         cursor = connection.cursor()
@@ -55,11 +59,12 @@ def setup_mysql_database():
         # Test the full connection string
         print("\n🧪 Testing full DATABASE_URL connection...")
         
-        test_connection = mysql.connector.connect(
+        test_connection = pymysql.connect(
             host=mysql_host,
             user=mysql_user,
             password=mysql_password,
-            database=mysql_database
+            database=mysql_database,
+            charset='utf8mb4'
         )
         
         test_cursor = test_connection.cursor()
@@ -70,13 +75,16 @@ def setup_mysql_database():
             print("✅ Full database connection test successful!")
         
         # Show existing tables
-        test_cursor.execute("SHOW TABLES")
+        test_cursor.execute(
+            "SELECT table_name FROM information_schema.tables "
+            "WHERE table_schema = %s ORDER BY table_name",
+            (mysql_database,)
+        )
         tables = test_cursor.fetchall()
         
         print(f"\n📋 Existing tables in '{mysql_database}':")
         if tables:
-            for table in tables:
-                print(f"  - {table[0]}")
+            print("\n".join(f"  - {table[0]}" for table in tables))
         else:
             print("  (No tables yet - will be created when Flask app starts)")
         
@@ -92,16 +100,17 @@ def setup_mysql_database():
         
         return True
         
-    except mysql.connector.Error as e:
+    except pymysql.MySQLError as e:
         print(f"\n❌ MySQL Error: {e}")
+        errno = e.args[0] if e.args else None
         
-        if e.errno == 1045:  # Access denied
+        if errno == 1045:  # Access denied
             print("\n🔧 Possible Solutions:")
             print("1. Check your MySQL password in config.env")
             print("2. Make sure MySQL server is running")
             print("3. Verify MySQL user has proper permissions")
             
-        elif e.errno == 2003:  # Can't connect to server
+        elif errno == 2003:  # Can't connect to server
             print("\n🔧 Possible Solutions:")
             print("1. Make sure MySQL server is running")
             print("2. Check if MySQL is listening on port 3306")
@@ -113,28 +122,22 @@ def setup_mysql_database():
         print(f"\n❌ Unexpected error: {e}")
         return False
 
-def check_mysql_status():
+def check_mysql_status(**overrides):
     """Check current MySQL connection status"""
     
     print("🔍 MySQL Connection Status Check")
     print("=" * 30)
     
-    # Load environment
-    load_dotenv()
-    load_dotenv('config.env')
-    
-    mysql_host = os.getenv('MYSQL_HOST', 'localhost')
-    mysql_user = os.getenv('MYSQL_USER', 'root')
-    mysql_password = os.getenv('MYSQL_PASSWORD', 'lenacjnv7')
-    mysql_database = os.getenv('MYSQL_DATABASE', 'traintiq_db')
+    mysql_host, mysql_user, mysql_password, mysql_database = mysql_settings(**overrides)
     
     try:
         # Test connection
-        connection = mysql.connector.connect(
+        connection = pymysql.connect(
             host=mysql_host,
             user=mysql_user,
             password=mysql_password,
-            database=mysql_database
+            database=mysql_database,
+            charset='utf8mb4'
         )
         
         cursor = connection.cursor()
@@ -151,10 +154,13 @@ def check_mysql_status():
         print(f"✅ Current Database: {current_db[0] if current_db else 'None'}")
         print(f"✅ Connection: Successful")
         
-        # Show tables
-        cursor.execute("SHOW TABLES")
-        tables = cursor.fetchall()
-        print(f"✅ Tables: {len(tables)} found")
+        # Count tables without listing them
+        cursor.execute(
+            "SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = %s",
+            (mysql_database,)
+        )
+        (table_count,) = cursor.fetchone()
+        print(f"✅ Tables: {table_count} found")
         
         cursor.close()
         connection.close()
@@ -166,10 +172,21 @@ def check_mysql_status():
         return False
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1 and sys.argv[1] == 'check':
-        check_mysql_status()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="TraintiQ MySQL database setup")
+    parser.add_argument('command', nargs='?', choices=['setup', 'check'], default='setup')
+    parser.add_argument('--host', help="MySQL host (default: MYSQL_HOST)")
+    parser.add_argument('--user', help="MySQL user (default: MYSQL_USER)")
+    parser.add_argument('--password', help="MySQL password (default: MYSQL_PASSWORD)")
+    parser.add_argument('--database', help="database name (default: MYSQL_DATABASE)")
+    args = parser.parse_args()
+    overrides = {'host': args.host, 'user': args.user, 'password': args.password, 'database': args.database}
+    
+    if args.command == 'check':
+        sys.exit(0 if check_mysql_status(**overrides) else 1)
     else:
-        success = setup_mysql_database()
+        success = setup_mysql_database(**overrides)
         
         if success:
             print("\n🚀 Next Steps:")
@@ -21,20 +21,55 @@ app = Flask(__name__)
 DATABASE_URL = "mysql+pymysql://root:@localhost/traintiq_db"
 app.config['SQLALCHEMY_DATABASE_URI'] = DATABASE_URL
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# No executemany tuning needed: PyMySQL's cursor.executemany() already folds INSERT ... VALUES
+# parameter sets into multi-row statements
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_pre_ping': True
+}
 
 # Initialize database
 db = SQLAlchemy(app)
 
 # Define the models directly here to avoid import issues
-from sqlalchemy import Column, String, Text, Integer, Float, DateTime, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, String, Text, Integer, Float, DateTime, Boolean, JSON, ForeignKey, Index, Computed, text
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.schema import CreateIndex, CreateTable
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from types import MappingProxyType
+import time
 import uuid
+import orjson
+
+def generate_uuid7():
+    """Generate a time-ordered UUIDv7 string so new primary keys append to the end of the index"""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+class OrJSON(TypeDecorator):
+    """JSON column type that encodes and decodes values with orjson instead of the stdlib json module"""
+    impl = JSON
+    cache_ok = True
+    
+    # Replace (rather than wrap) JSON's processors, which would run json.dumps/json.loads again
+    def bind_processor(self, dialect):
+        def process(value):
+            return None if value is None else orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+        return process
+    
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            return None if value is None else orjson.loads(value)
+        return process
 
 class Resume(db.Model):
     __tablename__ = 'resumes'
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=generate_uuid7)
     user_id = Column(String(36), nullable=True)
     original_filename = Column(String(255), nullable=False)
     file_path = Column(String(500), nullable=False)
@@ -42,19 +77,21 @@ class Resume(db.Model):
     file_type = Column(String(10), nullable=False)
     status = Column(String(50), nullable=False, default='uploaded')
     current_extraction_id = Column(String(36), nullable=True)
-    extracted_data = Column(JSON, nullable=True)
+    extracted_data = Column(OrJSON, nullable=True)
     confidence_score = Column(Float, nullable=True)
+    email_idx = Column(String(255), Computed("NULLIF(extracted_data ->> '$.contact_details.email', 'null')", persisted=True), index=True)
     upload_time = Column(DateTime, nullable=False, default=datetime.utcnow)
     last_updated = Column(DateTime, nullable=True)
-    resume_metadata = Column(JSON, nullable=True)
+    resume_metadata = Column(OrJSON, nullable=True)
 
 class ResumeSection(db.Model):
     __tablename__ = 'resume_sections'
+    __table_args__ = (Index('ix_section_resume_name', 'resume_id', 'section_name', unique=True),)
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=generate_uuid7)
     resume_id = Column(String(36), ForeignKey('resumes.id'), nullable=False)
     section_name = Column(String(100), nullable=False)
-    section_data = Column(JSON, nullable=False)
+    section_data = Column(OrJSON, nullable=False)
     confidence_score = Column(Float, nullable=True)
     extraction_method = Column(String(50), nullable=True)
     manually_edited = Column(Boolean, default=False)
@@ -63,15 +100,16 @@ class ResumeSection(db.Model):
 
 class ExtractionJob(db.Model):
     __tablename__ = 'extraction_jobs'
+    __table_args__ = (Index('ix_extraction_jobs_resume_status', 'resume_id', 'status'),)
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=generate_uuid7)
     resume_id = Column(String(36), ForeignKey('resumes.id'), nullable=False)
     user_id = Column(String(36), nullable=True)
-    extraction_options = Column(JSON, nullable=False)
+    extraction_options = Column(OrJSON, nullable=False)
     status = Column(String(50), nullable=False, default='queued')
     current_stage = Column(String(100), nullable=True)
     progress = Column(Integer, default=0)
-    extracted_data = Column(JSON, nullable=True)
+    extracted_data = Column(OrJSON, nullable=True)
     error_message = Column(Text, nullable=True)
     processing_time_seconds = Column(Float, nullable=True)
     tokens_processed = Column(Integer, nullable=True)
@@ -82,15 +120,16 @@ class ExtractionJob(db.Model):
 
 class ResumeTemplate(db.Model):
     __tablename__ = 'resume_templates'
+    __table_args__ = (Index('uq_resume_templates_name', 'name', unique=True),)
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=generate_uuid7)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
     template_type = Column(String(50), nullable=False)
-    template_data = Column(JSON, nullable=False)
+    template_data = Column(OrJSON, nullable=False)
     is_public = Column(Boolean, default=True)
     created_by = Column(String(36), nullable=True)
-    tags = Column(JSON, nullable=True)
+    tags = Column(OrJSON, nullable=True)
     usage_count = Column(Integer, default=0)
     rating = Column(Float, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -98,13 +137,14 @@ class ResumeTemplate(db.Model):
 
 class ResumeGeneration(db.Model):
     __tablename__ = 'resume_generations'
+    __table_args__ = (Index('ix_resume_generations_resume_template_status', 'resume_id', 'template_id', 'status'),)
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String(36), primary_key=True, default=generate_uuid7)
     resume_id = Column(String(36), ForeignKey('resumes.id'), nullable=False)
     template_id = Column(String(36), ForeignKey('resume_templates.id'), nullable=False)
     user_id = Column(String(36), nullable=True)
     format_type = Column(String(20), nullable=False)
-    generation_options = Column(JSON, nullable=True)
+    generation_options = Column(OrJSON, nullable=True)
     output_filename = Column(String(255), nullable=True)
     output_path = Column(String(500), nullable=True)
     output_size = Column(Integer, nullable=True)
@@ -113,14 +153,101 @@ class ResumeGeneration(db.Model):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
 
-def create_tables():
-    """Create all resume-related tables"""
+# CREATE TABLE IF NOT EXISTS statements compiled once, in foreign-key order
+CREATE_TABLE_DDL = tuple(
+    str(CreateTable(table, if_not_exists=True).compile(dialect=mysql.dialect()))
+    for table in db.metadata.sorted_tables
+)
+
+# Generated columns added after the tables first shipped: CREATE TABLE IF NOT EXISTS leaves older
+# tables without them, and the indexes on them cannot be created until they exist
+_mysql_ddl = mysql.dialect().ddl_compiler(mysql.dialect(), None)
+ADD_COLUMN_DDL = {
+    (column.table.name, column.name):
+        f"ALTER TABLE {column.table.name} ADD COLUMN {_mysql_ddl.get_column_specification(column)}"
+    for column in (Resume.__table__.c.email_idx,)
+}
+
+# Generated columns whose expression changed, keyed to a marker the current definition contains:
+# email_idx once stored the string 'null' for a JSON null email
+MODIFY_COLUMN_DDL = {
+    ('resumes', 'email_idx'): (
+        'nullif',
+        f"ALTER TABLE resumes MODIFY COLUMN {_mysql_ddl.get_column_specification(Resume.__table__.c.email_idx)}"
+    ),
+}
+
+# Rows that would violate a unique index added to an existing table, removed by the last statement
+DEDUPE_DDL = {
+    # Keep the most recently updated section per (resume, section name)
+    ('resume_sections', 'ix_section_resume_name'): (
+        "DELETE older FROM resume_sections AS older JOIN resume_sections AS newer "
+        "ON older.resume_id = newer.resume_id AND older.section_name = newer.section_name "
+        "AND (older.last_updated < newer.last_updated "
+        "OR (older.last_updated = newer.last_updated AND older.id < newer.id))",
+    ),
+    # Keep one template per name, moving generations off the duplicates so the foreign key holds
+    ('resume_templates', 'uq_resume_templates_name'): (
+        "UPDATE resume_generations AS g JOIN resume_templates AS dup ON g.template_id = dup.id "
+        "JOIN (SELECT name, MIN(id) AS id FROM resume_templates GROUP BY name) AS kept "
+        "ON kept.name = dup.name SET g.template_id = kept.id WHERE dup.id <> kept.id",
+        "DELETE dup FROM resume_templates AS dup "
+        "JOIN (SELECT name, MIN(id) AS id FROM resume_templates GROUP BY name) AS kept "
+        "ON kept.name = dup.name WHERE dup.id <> kept.id",
+    ),
+}
+
+# MySQL has no CREATE INDEX IF NOT EXISTS, so index DDL is keyed by (table, index) name
+CREATE_INDEX_DDL = {
+    (table.name, index.name): str(CreateIndex(index).compile(dialect=mysql.dialect()))
+    for table in db.metadata.sorted_tables
+    for index in table.indexes
+}
+
+def create_tables(reflect=False):
+    """Create all resume-related tables (reflect=True checks each table before creating it)"""
     with app.app_context():
         try:
             logger.info("Creating resume builder tables...")
             
-            # Create tables
-            db.create_all()
+            # Create tables, all on one connection inside a single begin() block
+            with db.engine.begin() as connection:
+                if reflect:
+                    for table in db.metadata.sorted_tables:
+                        table.create(bind=connection, checkfirst=True)
+                else:
+                    for ddl in CREATE_TABLE_DDL:
+                        connection.exec_driver_sql(ddl)
+                    
+                    existing_columns = {
+                        (table_name, column_name): expression or ''
+                        for table_name, column_name, expression in connection.execute(text(
+                            "SELECT table_name, column_name, generation_expression "
+                            "FROM information_schema.columns WHERE table_schema = DATABASE()"
+                        ))
+                    }
+                    for key, ddl in ADD_COLUMN_DDL.items():
+                        if key not in existing_columns:
+                            logger.info(f"Adding column {key[0]}.{key[1]}")
+                            connection.exec_driver_sql(ddl)
+                    for key, (marker, ddl) in MODIFY_COLUMN_DDL.items():
+                        if key in existing_columns and marker not in existing_columns[key].lower():
+                            logger.info(f"Redefining generated column {key[0]}.{key[1]}")
+                            connection.exec_driver_sql(ddl)
+                    
+                    # One information_schema query tells which indexes still need creating
+                    existing_indexes = set(connection.execute(text(
+                        "SELECT DISTINCT table_name, index_name FROM information_schema.statistics "
+                        "WHERE table_schema = DATABASE()"
+                    )).tuples())
+                    for key, ddl in CREATE_INDEX_DDL.items():
+                        if key not in existing_indexes:
+                            if key in DEDUPE_DDL:
+                                for statement in DEDUPE_DDL[key]:
+                                    removed = connection.exec_driver_sql(statement).rowcount
+                                if removed:
+                                    logger.warning(f"Removed {removed} duplicate rows from {key[0]} before creating {key[1]}")
+                            connection.exec_driver_sql(ddl)
             
             logger.info("Resume builder tables created successfully!")
             
@@ -133,74 +260,80 @@ def create_tables():
             logger.error(f"Migration failed: {str(e)}")
             raise
 
+# Default templates, built once at import; template_data is read-only
+_DEFAULT_TEMPLATES = (
+    {
+        'name': 'Modern Professional',
+        'description': 'A clean, modern template perfect for tech and business professionals',
+        'template_type': 'modern',
+        'template_data': MappingProxyType({
+            'layout': 'single-column',
+            'color_scheme': 'blue-gradient',
+            'font_family': 'Inter',
+            'sections': ['header', 'summary', 'experience', 'education', 'skills', 'projects']
+        }),
+        'tags': ['tech', 'professional', 'modern', 'ats-friendly'],
+        'is_public': True
+    },
+    {
+        'name': 'Classic Executive',
+        'description': 'Traditional format ideal for executive and senior management positions',
+        'template_type': 'classic',
+        'template_data': MappingProxyType({
+            'layout': 'two-column',
+            'color_scheme': 'navy-corporate',
+            'font_family': 'Times New Roman',
+            'sections': ['header', 'summary', 'experience', 'education', 'achievements', 'skills']
+        }),
+        'tags': ['executive', 'management', 'classic', 'corporate'],
+        'is_public': True
+    },
+    {
+        'name': 'Creative Portfolio',
+        'description': 'Eye-catching design for creative professionals and designers',
+        'template_type': 'creative',
+        'template_data': MappingProxyType({
+            'layout': 'asymmetric',
+            'color_scheme': 'purple-creative',
+            'font_family': 'Roboto',
+            'sections': ['header', 'portfolio', 'experience', 'skills', 'education', 'projects']
+        }),
+        'tags': ['creative', 'design', 'portfolio', 'visual'],
+        'is_public': True
+    },
+    {
+        'name': 'ATS-Optimized',
+        'description': 'Simple, clean format optimized for Applicant Tracking Systems',
+        'template_type': 'ats-friendly',
+        'template_data': MappingProxyType({
+            'layout': 'single-column',
+            'color_scheme': 'minimal-black',
+            'font_family': 'Arial',
+            'sections': ['header', 'summary', 'experience', 'education', 'skills', 'certifications']
+        }),
+        'tags': ['ats-friendly', 'simple', 'minimal', 'corporate'],
+        'is_public': True
+    }
+)
+
 def create_default_templates():
     """Create default resume templates"""
     try:
         logger.info("Creating default resume templates...")
         
-        templates = [
-            {
-                'name': 'Modern Professional',
-                'description': 'A clean, modern template perfect for tech and business professionals',
-                'template_type': 'modern',
-                'template_data': {
-                    'layout': 'single-column',
-                    'color_scheme': 'blue-gradient',
-                    'font_family': 'Inter',
-                    'sections': ['header', 'summary', 'experience', 'education', 'skills', 'projects']
-                },
-                'tags': ['tech', 'professional', 'modern', 'ats-friendly'],
-                'is_public': True
-            },
-            {
-                'name': 'Classic Executive',
-                'description': 'Traditional format ideal for executive and senior management positions',
-                'template_type': 'classic',
-                'template_data': {
-                    'layout': 'two-column',
-                    'color_scheme': 'navy-corporate',
-                    'font_family': 'Times New Roman',
-                    'sections': ['header', 'summary', 'experience', 'education', 'achievements', 'skills']
-                },
-                'tags': ['executive', 'management', 'classic', 'corporate'],
-                'is_public': True
-            },
-            {
-                'name': 'Creative Portfolio',
-                'description': 'Eye-catching design for creative professionals and designers',
-                'template_type': 'creative',
-                'template_data': {
-                    'layout': 'asymmetric',
-                    'color_scheme': 'purple-creative',
-                    'font_family': 'Roboto',
-                    'sections': ['header', 'portfolio', 'experience', 'skills', 'education', 'projects']
-                },
-                'tags': ['creative', 'design', 'portfolio', 'visual'],
-                'is_public': True
-            },
-            {
-                'name': 'ATS-Optimized',
-                'description': 'Simple, clean format optimized for Applicant Tracking Systems',
-                'template_type': 'ats-friendly',
-                'template_data': {
-                    'layout': 'single-column',
-                    'color_scheme': 'minimal-black',
-                    'font_family': 'Arial',
-                    'sections': ['header', 'summary', 'experience', 'education', 'skills', 'certifications']
-                },
-                'tags': ['ats-friendly', 'simple', 'minimal', 'corporate'],
-                'is_public': True
-            }
+        # A single upsert: the unique name turns already-present templates into no-op updates
+        now = datetime.utcnow()
+        rows = [
+            dict(t, id=generate_uuid7(), created_at=now, updated_at=now, template_data=dict(t['template_data']))
+            for t in _DEFAULT_TEMPLATES
         ]
+        # Core table insert run as one executemany: no ORM bulk-insert layer and a cached compiled statement
+        stmt = mysql_insert(ResumeTemplate.__table__)
+        stmt = stmt.on_duplicate_key_update(name=stmt.inserted.name)
+        with db.session.begin():
+            db.session.execute(stmt, rows)
         
-        for template_data in templates:
-            existing_template = ResumeTemplate.query.filter_by(name=template_data['name']).first()
-            if not existing_template:
-                template = ResumeTemplate(**template_data)
-                db.session.add(template)
-        
-        db.session.commit()
-        logger.info(f"Created {len(templates)} default resume templates")
+        logger.info(f"Ensured {len(rows)} default resume templates")
         
     except Exception as e:
         logger.error(f"Failed to create default templates: {str(e)}")
@@ -208,5 +341,11 @@ def create_default_templates():
         raise
 
 if __name__ == '__main__':
-    create_tables()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Create the resume builder tables")
+    parser.add_argument('--reflect', action='store_true', help="check each table with checkfirst instead of running the precompiled DDL")
+    args = parser.parse_args()
+    
+    create_tables(reflect=args.reflect)
     print("Resume builder database migration completed successfully!") 
\ No newline at end of file
@@ -4,34 +4,65 @@ Test script for TraintiQ Chat API
 Verifies that the chat system is working correctly.
 """
 
+import asyncio
+import orjson
 import requests
-import json
+import sys
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 
 # Configuration
 API_BASE_URL = "http://localhost:5000/api/chat"
 FRONTEND_URL = "http://localhost:4200"
 
-def test_health_check():
+# One keep-alive session for every check, so requests reuse the same TCP connection
+SESSION = requests.Session()
+SESSION.headers.update({'Content-Type': 'application/json', 'Accept': 'application/json'})
+# Room for the concurrent checks plus a couple of quick retries on connection failures
+SESSION.mount('http://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+
+def buffered(test):
+    """Run a test with an out() that collects its lines, then write them to stdout in one call"""
+    def wrapper():
+        lines = []
+        try:
+            return test(lines.append)
+        finally:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+    # Copy only the name and docstring: setting __wrapped__ (as functools.wraps does) would make
+    # pytest collect the inner test(out) signature and look for an 'out' fixture
+    wrapper.__name__ = wrapper.__qualname__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+@buffered
+def test_health_check(out):
     """Test the health check endpoint"""
-    print("🔍 Testing health check...")
+    out("🔍 Testing health check...")
     try:
-        response = requests.get(f"{API_BASE_URL}/health")
+        response = SESSION.get(f"{API_BASE_URL}/health")
         if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Health check passed: {data['message']}")
+            data = orjson.loads(response.content)
+            out(f"✅ Health check passed: {data['message']}")
             return True
         else:
-            print(f"❌ Health check failed: {response.status_code}")
+            out(f"❌ Health check failed: {response.status_code}")
             return False
     except Exception as e:
-        print(f"❌ Health check error: {str(e)}")
+        out(f"❌ Health check error: {str(e)}")
         return False
 
-def test_chat_message():
+@buffered
+def test_chat_message(out):
     """Test sending a chat message"""
-    print("\n💬 Testing chat message...")
+    out("\n💬 Testing chat message...")
     
     test_message = "Hello! What services does TraintiQ offer?"
     
@@ -41,33 +72,33 @@ def test_chat_message():
     }
     
     try:
-        print(f"📤 Sending: {test_message}")
-        response = requests.post(
+        out(f"📤 Sending: {test_message}")
+        response = SESSION.post(
             f"{API_BASE_URL}/message",
-            json=payload,
-            headers={"Content-Type": "application/json"}
+            data=orjson.dumps(payload)
         )
         
         if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Chat response received:")
-            print(f"📝 Message: {data['response'][:100]}...")
-            print(f"🎯 Quick replies: {data.get('quick_replies', [])}")
-            print(f"⚡ Model used: {data.get('model_used', 'N/A')}")
-            print(f"🔢 Tokens used: {data.get('tokens_used', 'N/A')}")
+            data = orjson.loads(response.content)
+            out(f"✅ Chat response received:")
+            out(f"📝 Message: {data['response'][:100]}...")
+            out(f"🎯 Quick replies: {data.get('quick_replies', [])}")
+            out(f"⚡ Model used: {data.get('model_used', 'N/A')}")
+            out(f"🔢 Tokens used: {data.get('tokens_used', 'N/A')}")
             return True
         else:
-            print(f"❌ Chat message failed: {response.status_code}")
-            print(f"Response: {response.text}")
+            out(f"❌ Chat message failed: {response.status_code}")
+            out(f"Response: {response.text}")
             return False
             
     except Exception as e:
-        print(f"❌ Chat message error: {str(e)}")
+        out(f"❌ Chat message error: {str(e)}")
         return False
 
-def test_multiple_messages():
+@buffered
+def test_multiple_messages(out):
     """Test conversation flow with multiple messages"""
-    print("\n🔄 Testing conversation flow...")
+    out("\n🔄 Testing conversation flow...")
     
     session_id = f"test_conversation_{int(time.time())}"
     
@@ -80,8 +111,9 @@ def test_multiple_messages():
     
     success_count = 0
     
+    # Messages stay sequential: each one is part of the same conversation
     for i, message in enumerate(test_messages, 1):
-        print(f"\n📤 Message {i}: {message}")
+        out(f"\n📤 Message {i}: {message}")
         
         payload = {
             "message": message,
@@ -89,90 +121,98 @@ def test_multiple_messages():
         }
         
         try:
-            response = requests.post(
+            response = SESSION.post(
                 f"{API_BASE_URL}/message",
-                json=payload,
-                headers={"Content-Type": "application/json"}
+                data=orjson.dumps(payload)
             )
             
             if response.status_code == 200:
-                data = response.json()
-                print(f"✅ Response {i}: {data['response'][:80]}...")
-                print(f"🎯 Quick replies: {data.get('quick_replies', [])[:3]}")
+                data = orjson.loads(response.content)
+                out(f"✅ Response {i}: {data['response'][:80]}...")
+                out(f"🎯 Quick replies: {data.get('quick_replies', [])[:3]}")
                 success_count += 1
             else:
-                print(f"❌ Message {i} failed: {response.status_code}")
+                out(f"❌ Message {i} failed: {response.status_code}")
                 
         except Exception as e:
-            print(f"❌ Message {i} error: {str(e)}")
+            out(f"❌ Message {i} error: {str(e)}")
     
-    print(f"\n📊 Conversation test: {success_count}/{len(test_messages)} messages successful")
+    out(f"\n📊 Conversation test: {success_count}/{len(test_messages)} messages successful")
     return success_count == len(test_messages)
 
-def check_frontend_accessibility():
+@buffered
+def check_frontend_accessibility(out):
     """Check if the frontend is accessible"""
-    print("\n🌐 Checking frontend accessibility...")
+    out("\n🌐 Checking frontend accessibility...")
     try:
-        response = requests.get(FRONTEND_URL, timeout=5)
+        response = SESSION.get(FRONTEND_URL, timeout=5)
         if response.status_code == 200:
-            print("✅ Frontend is accessible at http://localhost:4200")
+            out("✅ Frontend is accessible at http://localhost:4200")
             return True
         else:
-            print(f"❌ Frontend returned status code: {response.status_code}")
+            out(f"❌ Frontend returned status code: {response.status_code}")
             return False
     except Exception as e:
-        print(f"❌ Frontend not accessible: {str(e)}")
+        out(f"❌ Frontend not accessible: {str(e)}")
         return False
 
-def main():
-    """Run all tests"""
-    print("🚀 TraintiQ Chat System Test Suite")
-    print("=" * 50)
-    
-    test_results = []
+async def run_tests():
+    """Run the independent checks concurrently, then the ordered conversation"""
+    # Tests 1, 2 and 4: Health Check, Single Chat Message and Frontend Accessibility
+    health, chat, frontend = await asyncio.gather(
+        asyncio.to_thread(test_health_check),
+        asyncio.to_thread(test_chat_message),
+        asyncio.to_thread(check_frontend_accessibility)
+    )
     
-    # Test 1: Health Check
-    test_results.append(test_health_check())
+    # Test 3: Conversation Flow
+    conversation = await asyncio.to_thread(test_multiple_messages)
     
-    # Test 2: Single Chat Message
-    test_results.append(test_chat_message())
+    return [health, chat, conversation, frontend]
+
+def main():
+    """Run all tests"""
+    sys.stdout.write("🚀 TraintiQ Chat System Test Suite\n" + "=" * 50 + "\n")
+    sys.stdout.flush()
     
-    # Test 3: Conversation Flow
-    test_results.append(test_multiple_messages())
+    test_results = asyncio.run(run_tests())
     
-    # Test 4: Frontend Accessibility
-    test_results.append(check_frontend_accessibility())
+    # Summary, collected and written in one go
+    lines = []
+    out = lines.append
     
-    # Summary
-    print("\n" + "=" * 50)
-    print("📊 TEST SUMMARY")
-    print("=" * 50)
+    out("\n" + "=" * 50)
+    out("📊 TEST SUMMARY")
+    out("=" * 50)
     
     passed = sum(test_results)
     total = len(test_results)
     
-    print(f"✅ Tests passed: {passed}/{total}")
+    out(f"✅ Tests passed: {passed}/{total}")
     
     if passed == total:
-        print("🎉 All tests passed! Your chat system is working perfectly!")
-        print("\n🔗 Quick Links:")
-        print(f"   • Frontend: {FRONTEND_URL}")
-        print(f"   • API Health: {API_BASE_URL}/health")
-        print(f"   • Chat API: {API_BASE_URL}/message")
+        out("🎉 All tests passed! Your chat system is working perfectly!")
+        out("\n🔗 Quick Links:")
+        out(f"   • Frontend: {FRONTEND_URL}")
+        out(f"   • API Health: {API_BASE_URL}/health")
+        out(f"   • Chat API: {API_BASE_URL}/message")
         
-        print("\n💡 Next Steps:")
-        print("   1. Open your browser to http://localhost:4200")
-        print("   2. Look for the chat button in the bottom-right corner")
-        print("   3. Click to start chatting with the AI assistant!")
-        print("   4. Try asking about TraintiQ services, pricing, or support")
+        out("\n💡 Next Steps:")
+        out("   1. Open your browser to http://localhost:4200")
+        out("   2. Look for the chat button in the bottom-right corner")
+        out("   3. Click to start chatting with the AI assistant!")
+        out("   4. Try asking about TraintiQ services, pricing, or support")
         
     else:
-        print(f"⚠️  {total - passed} test(s) failed. Please check the error messages above.")
-        print("\n🔧 Troubleshooting Tips:")
-        print("   • Make sure both servers are running (Flask & Angular)")
-        print("   • Check your OpenAI API key is configured correctly")
-        print("   • Verify MySQL database is running and accessible")
-        print("   • Check console logs for detailed error messages")
+        out(f"⚠️  {total - passed} test(s) failed. Please check the error messages above.")
+        out("\n🔧 Troubleshooting Tips:")
+        out("   • Make sure both servers are running (Flask & Angular)")
+        out("   • Check your OpenAI API key is configured correctly")
+        out("   • Verify MySQL database is running and accessible")
+        out("   • Check console logs for detailed error messages")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -10,25 +10,30 @@ def test_env_loading():
     print("🧪 Testing Environment Variable Loading")
     print("=" * 40)
     
+    env = os.environ
+    
     # Before loading
     print("Before loading dotenv:")
-    print(f"  DATABASE_URL: {os.environ.get('DATABASE_URL', 'NOT SET')}")
-    print(f"  OPENAI_API_KEY: {os.environ.get('OPENAI_API_KEY', 'NOT SET')}")
+    print(f"  DATABASE_URL: {env.get('DATABASE_URL', 'NOT SET')}")
+    print(f"  OPENAI_API_KEY: {env.get('OPENAI_API_KEY', 'NOT SET')}")
     
     # Load .env files in same order as app
     print("\nLoading .env files...")
     result1 = load_dotenv('config.env')  # Load config.env FIRST (higher priority)
     print(f"  load_dotenv('config.env') result: {result1}")
     
-    result2 = load_dotenv()  # Load .env as backup
-    print(f"  load_dotenv() result: {result2}")
+    if result1:
+        print("  load_dotenv() skipped: config.env already loaded")
+    else:
+        result2 = load_dotenv()  # Load .env as backup
+        print(f"  load_dotenv() result: {result2}")
     
     # After loading
     print("\nAfter loading dotenv:")
-    print(f"  DATABASE_URL: {os.environ.get('DATABASE_URL', 'NOT SET')}")
-    print(f"  OPENAI_API_KEY: {os.environ.get('OPENAI_API_KEY', 'NOT SET')}")
-    print(f"  SECRET_KEY: {os.environ.get('SECRET_KEY', 'NOT SET')}")
-    print(f"  MYSQL_HOST: {os.environ.get('MYSQL_HOST', 'NOT SET')}")
+    print(f"  DATABASE_URL: {env.get('DATABASE_URL', 'NOT SET')}")
+    print(f"  OPENAI_API_KEY: {env.get('OPENAI_API_KEY', 'NOT SET')}")
+    print(f"  SECRET_KEY: {env.get('SECRET_KEY', 'NOT SET')}")
+    print(f"  MYSQL_HOST: {env.get('MYSQL_HOST', 'NOT SET')}")
     
     # Test config construction
     print("\n🔧 Testing Config Construction:")
@@ -52,10 +57,10 @@ def test_env_loading():
         
         # Show first few lines
         print("  config.env first 5 lines:")
-        with open('config.env', 'r') as f:
-            for i, line in enumerate(f):
-                if i < 5:
-                    print(f"    {i+1}: {line.rstrip()}")
+        with open('config.env', 'rb') as f:
+            head = f.read(4096).splitlines()[:5]
+        for i, line in enumerate(head, 1):
+            print(f"    {i}: {line.decode('utf-8', errors='replace').rstrip()}")
 
 if __name__ == "__main__":
     test_env_loading() 
\ No newline at end of file
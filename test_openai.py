@@ -6,11 +6,12 @@ Test OpenAI API connectivity
 import os
 from dotenv import load_dotenv
 
-# Load environment
-load_dotenv('config.env')
-load_dotenv()
+# Load environment (.env only as a fallback when config.env is missing)
+if not load_dotenv('config.env'):
+    load_dotenv()
 
-def test_openai():
+def test_openai(deep=False):
+    """Check the key with a model listing; deep=True also runs a small chat completion"""
     print("🧪 Testing OpenAI API")
     print("=" * 30)
     
@@ -30,16 +31,21 @@ def test_openai():
         client = OpenAI(api_key=api_key)
         print("✅ OpenAI client initialized successfully")
         
-        # Test API call
+        # Test API call - listing models authenticates without spending tokens
         print("📞 Testing API call...")
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": "Hello, just testing!"}],
-            max_tokens=10
-        )
-        
+        models = client.models.list()
         print("✅ API call successful!")
-        print(f"Response: {response.choices[0].message.content}")
+        print(f"Models available: {len(models.data)}")
+        
+        if deep:
+            print("📞 Testing chat completion...")
+            response = client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": "Hello, just testing!"}],
+                max_tokens=10
+            )
+            print("✅ Chat completion successful!")
+            print(f"Response: {response.choices[0].message.content}")
         
     except Exception as e:
         print(f"❌ Error: {str(e)}")
@@ -48,4 +54,10 @@ def test_openai():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    test_openai() 
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Test OpenAI API connectivity")
+    parser.add_argument('--deep', action='store_true', help="also run a small chat completion")
+    args = parser.parse_args()
+    
+    test_openai(deep=args.deep) 
\ No newline at end of file
@@ -1,5 +1,5 @@
+import orjson
 import requests
-import json
 
 # Your dummy data
 data = {
@@ -155,9 +155,9 @@ url = "http://localhost:5000/api/company/"
 headers = {"Content-Type": "application/json"}
 
 try:
-    response = requests.post(url, json=data, headers=headers)
+    response = requests.post(url, data=orjson.dumps(data), headers=headers)
     print(f"Status Code: {response.status_code}")
     print("Response:")
-    print(json.dumps(response.json(), indent=2))
+    print(orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode())
 except Exception as e:
     print(f"Error: {str(e)}") 
\ No newline at end of file
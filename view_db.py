@@ -1,16 +1,32 @@
+from sqlalchemy import JSON, select, type_coerce
 from app import create_app, db
 from app.models.company import Company
 
-def view_companies():
-    app = create_app()
+_APP = None
+
+def _app():
+    """Create the Flask app on first use and reuse it afterwards"""
+    global _APP
+    if _APP is None:
+        _APP = create_app()
+    return _APP
+
+def view_companies(app=None):
+    app = app or _app()
     with app.app_context():
-        companies = Company.query.all()
-        print(f"\nFound {len(companies)} companies in database:")
-        for company in companies:
-            print(f"\nCompany ID: {company._id}")
-            if company.basicInfo and 'legalName' in company.basicInfo:
-                print(f"Name: {company.basicInfo['legalName']}")
-            print("-" * 50)
+        # Let the database extract legalName so only the id and one short string per row are sent,
+        # streamed in bounded batches instead of loading every Company
+        legal_name = type_coerce(Company.basicInfo, JSON)['legalName'].as_string()
+        stmt = select(Company.id, legal_name).execution_options(yield_per=500)
+        count = 0
+        for partition in db.session.execute(stmt).partitions():
+            for company_id, name in partition:
+                count += 1
+                print(f"\nCompany ID: {company_id}")
+                if name:
+                    print(f"Name: {name}")
+                print("-" * 50)
+        print(f"\nFound {count} companies in database")
 
 if __name__ == "__main__":
-    view_companies() 
\ No newline at end of file
+    view_companies(_app())